@@ -1,6 +1,8 @@
 """Celery tasks for workflow execution."""
 
 import asyncio
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
@@ -509,12 +511,13 @@ def _track_generated_content(
             if value and key not in _NON_CONTENT_STATE_KEYS and not key.startswith("_")
         ]
 
-    for step_id in step_identifiers:
-        session_crud.add_available_content_identifier(db, session_id, step_id)
+    # Register all produced identifiers with one session update instead of one per step
+    if step_identifiers:
+        session_crud.add_available_content_identifiers(db, session_id, step_identifiers)
         logger.debug(
-            "content_identifier_ensured_in_session",
+            "content_identifiers_ensured_in_session",
             session_id=session_id,
-            step_id=step_id,
+            step_ids=step_identifiers,
         )
 
     # Get created content IDs for logging
@@ -554,8 +557,6 @@ def _handle_workflow_error(
         task_self: Celery task self object (for retry)
         db: Optional database session
     """
-    import traceback
-
     tb_lines = traceback.format_exception(type(e), e, e.__traceback__)
     tb_str = "".join(tb_lines)
 
@@ -627,19 +628,21 @@ def _handle_workflow_error(
 )
 def process_audio_upload(self, audio_file_id: int) -> dict:  # noqa: ARG001
     """
-    Convert a raw uploaded audio file to FLAC chunks and store them in S3.
+    Convert a raw uploaded audio file to audio chunks (AUDIO_CHUNK_CODEC) and store them in S3.
 
     Steps:
     1. Load SessionAudioFile record (must be in PENDING status).
     2. Mark as PROCESSING.
     3. Download raw file from S3.
-    4. Convert to FLAC chunks via ffmpeg.
+    4. Convert to chunks in the configured codec (FLAC or Opus) via ffmpeg.
     5. Upload chunks to S3 under a stable prefix.
     6. Mark as PROCESSED and clear s3_raw_key.
     7. Delete raw file from S3.
 
     Any failure marks the record FAILED immediately (no retry).
     """
+    from app.config.settings import get_settings
+
     db = None
     s3: S3AudioService | None = None
     try:
@@ -682,14 +685,27 @@ def process_audio_upload(self, audio_file_id: int) -> dict:  # noqa: ARG001
         # Download raw file
         raw_data = s3.download_raw(raw_key)
 
-        # Convert to FLAC chunks via ffmpeg
+        # Convert to FLAC/Opus chunks via ffmpeg
         processor = AudioProcessingService()
         chunks = processor.process(raw_data, record.original_filename)
 
-        # Upload chunks
+        # Upload chunks concurrently; put_object is network-bound and the boto3
+        # client is thread-safe. Consuming the map re-raises the first failure.
         chunk_prefix = s3.chunk_s3_prefix(session_id, audio_file_id)
-        for idx, chunk_bytes in enumerate(chunks):
-            s3.upload_chunk(session_id, audio_file_id, idx, chunk_bytes)
+        max_workers = max(1, min(get_settings().audio_chunk_upload_max_workers, len(chunks)))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(
+                pool.map(
+                    lambda item: s3.upload_chunk(
+                        session_id,
+                        audio_file_id,
+                        item[0],
+                        item[1],
+                        extension=processor.chunk_extension,
+                    ),
+                    enumerate(chunks),
+                )
+            )
 
         # Mark processed and clear raw key
         audio_file_crud.update_audio_file_processed(db, audio_file_id, chunk_prefix, len(chunks))
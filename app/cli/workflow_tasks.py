@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
@@ -29,8 +30,6 @@ _TERMINAL_CELERY_STATES = {"SUCCESS", "FAILURE", "REVOKED"}
 @lru_cache(maxsize=1)
 def _get_celery_client() -> Celery:
     """Create a lightweight Celery client without importing worker task modules."""
-    import os
-
     return Celery(
         "summaraizer_cli",
         broker=os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0"),
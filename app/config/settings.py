@@ -1,5 +1,6 @@
 """Application settings and configuration."""
 
+import json
 import os
 from functools import lru_cache
 
@@ -180,8 +181,20 @@ class Settings(BaseSettings):
     # Audio transcription configuration
     # FLAC compression level (0=fastest/largest … 8=best/smallest)
     audio_flac_compression_level: int = int(os.getenv("AUDIO_FLAC_COMPRESSION_LEVEL", "5"))
+    # Codec for transcription chunks: "flac" (lossless) or "opus" (~10x smaller uploads);
+    # "opus" falls back to "flac" with a warning if ffmpeg was built without libopus
+    audio_chunk_codec: str = os.getenv("AUDIO_CHUNK_CODEC", "flac").lower()
+    # Opus bitrate used when AUDIO_CHUNK_CODEC=opus
+    audio_opus_bitrate: str = os.getenv("AUDIO_OPUS_BITRATE", "24k")
+    # Scratch directory for ffmpeg input/segments; empty = system temp dir
+    # (point at a tmpfs such as /dev/shm to keep transient audio off disk)
+    audio_processing_tmp_dir: str = os.getenv("AUDIO_PROCESSING_TMP_DIR", "")
+    # Number of audio chunks uploaded to S3 concurrently after audio processing
+    audio_chunk_upload_max_workers: int = int(os.getenv("AUDIO_CHUNK_UPLOAD_MAX_WORKERS", "4"))
     # Duration of each audio segment sent to Whisper (seconds)
     transcribe_segment_seconds: int = int(os.getenv("TRANSCRIBE_SEGMENT_SECONDS", "170"))
+    # Number of audio chunks transcribed concurrently by the Whisper provider
+    transcribe_max_workers: int = int(os.getenv("TRANSCRIBE_MAX_WORKERS", "4"))
     # Maximum single file size accepted by the Whisper endpoint (MB)
     transcribe_max_file_size_mb: int = int(os.getenv("TRANSCRIBE_MAX_FILE_SIZE_MB", "25"))
     # Whisper model name at the transcription endpoint
@@ -214,8 +227,6 @@ class Settings(BaseSettings):
             raw = value.strip()
             if raw.startswith("[") and raw.endswith("]"):
                 # Allow JSON list syntax in env (e.g. ["RS256"]).
-                import json
-
                 try:
                     parsed = json.loads(raw)
                     if isinstance(parsed, list):
@@ -86,10 +86,7 @@ def update_audio_file_status(
 
 
 def delete_audio_file(db: SQLSession, audio_file_id: int) -> bool:
-    """Delete a SessionAudioFile record. Returns True if deleted."""
-    record = get_audio_file(db, audio_file_id)
-    if record:
-        db.delete(record)
-        db.commit()
-        return True
-    return False
+    """Delete a SessionAudioFile record with a single DELETE statement. Returns True if deleted."""
+    count = db.query(SessionAudioFile).filter(SessionAudioFile.id == audio_file_id).delete()
+    db.commit()
+    return count > 0
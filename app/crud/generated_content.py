@@ -113,8 +113,12 @@ def create_or_update_content(
 
 
 def get_content_by_id(db: SQLSession, content_id: int) -> GeneratedContent | None:
-    """Get content by ID."""
-    return db.query(GeneratedContent).filter(GeneratedContent.id == content_id).first()
+    """Get content by ID.
+
+    Uses the session's identity map, so a record the caller has already loaded
+    (e.g. by identifier right before an update) is returned without another SELECT.
+    """
+    return db.get(GeneratedContent, content_id)
 
 
 def get_content_by_identifier(
@@ -152,6 +156,57 @@ def list_for_session(
     return query.order_by(GeneratedContent.created_at.asc()).all()
 
 
+def list_session_ids_with_content(db: SQLSession, session_ids: list[int]) -> set[int]:
+    """
+    Return the subset of session IDs that have at least one generated content row.
+
+    Batched variant of checking `list_for_session` per session: one query
+    for the whole list instead of one per session.
+    """
+    if not session_ids:
+        return set()
+
+    rows = (
+        db.query(GeneratedContent.session_id)
+        .filter(GeneratedContent.session_id.in_(session_ids))
+        .distinct()
+        .all()
+    )
+    return {row[0] for row in rows}
+
+
+def get_latest_contents_for_sessions(
+    db: SQLSession, session_ids: list[int], identifiers: list[str]
+) -> dict[tuple[int, str], GeneratedContent]:
+    """
+    Get the latest content per (session_id, identifier) for many sessions at once.
+
+    Batched variant of calling `get_content_by_identifier` per session and identifier.
+
+    Args:
+        db: Database session
+        session_ids: Sessions to look up
+        identifiers: Content identifiers to include
+
+    Returns:
+        Mapping of (session_id, identifier) to the most recently created record
+    """
+    if not session_ids or not identifiers:
+        return {}
+
+    rows = (
+        db.query(GeneratedContent)
+        .filter(
+            GeneratedContent.session_id.in_(session_ids),
+            GeneratedContent.identifier.in_(identifiers),
+        )
+        .order_by(GeneratedContent.created_at.asc())
+        .all()
+    )
+    # Ascending order, so later (newer) rows overwrite older ones
+    return {(row.session_id, row.identifier): row for row in rows}
+
+
 def list_content_identifiers(db: SQLSession, session_id: int) -> list[str]:
     """Get list of available identifiers for session."""
     contents = (
@@ -200,13 +255,10 @@ def update_content_editorial_review(
 
 
 def delete_content(db: SQLSession, content_id: int) -> bool:
-    """Delete content by ID."""
-    db_content = get_content_by_id(db, content_id)
-    if db_content:
-        db.delete(db_content)
-        db.commit()
-        return True
-    return False
+    """Delete content by ID with a single DELETE statement."""
+    count = db.query(GeneratedContent).filter(GeneratedContent.id == content_id).delete()
+    db.commit()
+    return count > 0
 
 
 def delete_content_by_identifier(db: SQLSession, session_id: int, identifier: str) -> bool:
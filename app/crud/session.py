@@ -1,8 +1,8 @@
 """CRUD operations for Session model."""
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
 import structlog
 from sqlalchemy import and_, func, or_
@@ -24,6 +24,8 @@ from app.schemas.session import SessionCreate, SessionExternalIdCreate, SessionU
 
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+
 
 def _invalidate_query_refinement_cache(event_ids: set[int | None]) -> None:
     """Invalidate cached refinement metadata for affected events."""
@@ -239,18 +241,14 @@ class CRUDSession(CRUDBase[SessionModel, SessionCreate, SessionUpdate]):
             .all()
         )
 
-        unique_tags: set[str] = set()
-        unique_locations: set[str] = set()
-
-        for tags, city, _loc_name in rows:
-            if isinstance(tags, Iterable) and not isinstance(tags, str):
-                for tag in tags:
-                    tag_text = str(tag).strip()
-                    if tag_text:
-                        unique_tags.add(tag_text)
-
-            if city:
-                unique_locations.add(str(city).strip())
+        unique_tags = {
+            tag_text
+            for tags, _city, _loc_name in rows
+            if isinstance(tags, Iterable) and not isinstance(tags, str)
+            for tag in tags
+            if (tag_text := str(tag).strip())
+        }
+        unique_locations = {str(city).strip() for _tags, city, _loc_name in rows if city}
 
         return sorted(unique_tags), sorted(unique_locations)
 
@@ -802,37 +800,102 @@ class CRUDSession(CRUDBase[SessionModel, SessionCreate, SessionUpdate]):
         return claim
 
     def add_available_content_identifier(
-        self, db: Session, session_id: int, identifier: str
+        self, db: Session, session_id: int, identifier: str, commit: bool = True
     ) -> SessionModel | None:
         """Add content identifier to session's available_content_identifiers if not already present."""
+        return self.add_available_content_identifiers(db, session_id, [identifier], commit=commit)
+
+    def add_available_content_identifiers(
+        self, db: Session, session_id: int, identifiers: list[str], commit: bool = True
+    ) -> SessionModel | None:
+        """
+        Add several content identifiers to a session in a single read-modify-write.
+
+        Identifiers already present are skipped; nothing is committed if all are present.
+
+        Args:
+            db: Database session
+            session_id: Session ID
+            identifiers: Content identifiers to ensure, in insertion order
+            commit: If False, only stage the change so it is committed together with
+                the caller's next commit (e.g. the content record it belongs to).
+                Prefer add_available_content_identifier_with, which also refreshes,
+                logs after the commit and rolls back on failure.
+
+        Returns:
+            Updated session, or None if the session does not exist
+        """
         try:
             db_obj = self.read(db, session_id)
             if not db_obj:
                 return None
 
-            if identifier not in db_obj.available_content_identifiers:
+            existing = db_obj.available_content_identifiers
+            missing = [
+                identifier
+                for identifier in dict.fromkeys(identifiers)
+                if identifier not in existing
+            ]
+            if missing:
                 # Explicitly reassign to trigger SQLAlchemy's change tracking for JSON columns
-                updated_list = [*db_obj.available_content_identifiers, identifier]
-                db_obj.available_content_identifiers = updated_list
+                db_obj.available_content_identifiers = [*existing, *missing]
                 db.add(db_obj)
-                db.commit()
-                db.refresh(db_obj)
-                logger.info(
-                    "content_identifier_added",
-                    session_id=session_id,
-                    identifier=identifier,
-                )
+                if commit:
+                    db.commit()
+                    db.refresh(db_obj)
+                    logger.info(
+                        "content_identifier_added",
+                        session_id=session_id,
+                        identifiers=missing,
+                    )
             return db_obj
         except SQLAlchemyError as e:
             db.rollback()
             logger.error(
                 "add_content_identifier_failed",
                 session_id=session_id,
-                identifier=identifier,
+                identifiers=identifiers,
                 error=str(e),
             )
             raise
 
+    def add_available_content_identifier_with(
+        self, db: Session, session_id: int, identifier: str, save: Callable[[], T]
+    ) -> T:
+        """
+        Add a content identifier in the same transaction as the content it belongs to.
+
+        The identifier is staged, then ``save`` writes and commits the content record.
+        The session is refreshed afterwards so instances held by the caller stay
+        loaded. If ``save`` fails, the staged identifier is rolled back.
+
+        Args:
+            db: Database session
+            session_id: Session ID
+            identifier: Content identifier to ensure
+            save: Callable that writes and commits the content record
+
+        Returns:
+            Whatever ``save`` returns
+        """
+        db_obj = self.add_available_content_identifiers(db, session_id, [identifier], commit=False)
+        staged = db_obj is not None and db.is_modified(db_obj)
+        try:
+            result = save()
+        except Exception:
+            db.rollback()
+            raise
+
+        if db_obj is not None:
+            db.refresh(db_obj)
+        if staged:
+            logger.info(
+                "content_identifier_added",
+                session_id=session_id,
+                identifiers=[identifier],
+            )
+        return result
+
     def remove_available_content_identifier(
         self, db: Session, session_id: int, identifier: str
     ) -> SessionModel | None:
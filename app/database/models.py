@@ -520,7 +520,8 @@ class SessionAudioFile(Base):
     # Raw S3 key: set on upload, cleared (set to None) after processing succeeds.
     # Retained on failure for debug — may be cleaned up manually.
     s3_raw_key = Column(String(1000), nullable=True)
-    # Prefix of processed FLAC chunks, e.g. content/summaraizer/session_1/audio_2/
+    # Prefix of processed audio chunks (FLAC or Ogg/Opus),
+    # e.g. content/summaraizer/session_1/audio_2/
     s3_prefix = Column(String(1000), nullable=True)
     chunk_count = Column(Integer, nullable=True)
     total_size_bytes = Column(Integer, nullable=True)
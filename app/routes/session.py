@@ -1,12 +1,15 @@
 """API routes for Session CRUD management (core resource)."""
 
+import hashlib
+
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy import String, and_, cast, exists, func, or_
 from sqlalchemy.orm import Session, joinedload
 from starlette.status import (
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_304_NOT_MODIFIED,
     HTTP_404_NOT_FOUND,
     HTTP_409_CONFLICT,
 )
@@ -55,6 +58,17 @@ logger = structlog.get_logger()
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
+COVER_IMAGE_IDENTIFIERS = frozenset({"cover_image", "cover", "hero_image"})
+IMAGE_URL_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg")
+
+
+def _is_image_url(value: object) -> bool:
+    """Return True if value is a non-empty string that looks like an image URL."""
+    if not isinstance(value, str) or value.strip() == "":
+        return False
+    lowered = value.lower()
+    return any(ext in lowered for ext in IMAGE_URL_EXTENSIONS)
+
 
 def _extract_cover_image_url(session: SessionModel) -> str | None:
     """Extract a cover image URL from the published documentation artifact if available."""
@@ -66,16 +80,6 @@ def _extract_cover_image_url(session: SessionModel) -> str | None:
     if not isinstance(sections, list):
         return None
 
-    preferred_identifiers = {"cover_image", "cover", "hero_image"}
-
-    def _is_image_url(value: object) -> bool:
-        if not isinstance(value, str) or value.strip() == "":
-            return False
-        lowered = value.lower()
-        return any(
-            ext in lowered for ext in [".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg"]
-        )
-
     first_any: object | None = None
     for section in sections:
         if not isinstance(section, dict):
@@ -84,7 +88,7 @@ def _extract_cover_image_url(session: SessionModel) -> str | None:
         identifier = str(section.get("identifier") or "").strip().lower()
         url = section.get("resource_url")
         if _is_image_url(url):
-            if identifier in preferred_identifiers:
+            if identifier in COVER_IMAGE_IDENTIFIERS:
                 return str(url)
             if first_any is None:
                 first_any = url
@@ -92,6 +96,29 @@ def _extract_cover_image_url(session: SessionModel) -> str | None:
     return str(first_any) if first_any is not None else None
 
 
+def _documentation_etag(artifact: dict) -> str:
+    """
+    Build a strong ETag for a stored documentation artifact.
+
+    The artifact is rewritten as a whole on every rebuild, which refreshes
+    its generated_at timestamp, so (id, doc_version, generated_at) identifies
+    the serialized body without hashing the full payload.
+    """
+    fingerprint = (
+        f"{artifact.get('id')}:{artifact.get('doc_version')}:{artifact.get('generated_at')}"
+    )
+    return f'"{hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match header matches the given ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
 def _resolve_session_sort(sort_by: str, sort_dir: str):
     """Resolve supported session sort options with stable secondary ordering."""
     sort_fields = {
@@ -1067,15 +1094,16 @@ async def rebuild_all_documentation(
     )
     sessions = [s for s in sessions if s.published_documentation_artifact is not None]
 
+    # Resolve content presence for all sessions in one query instead of one per session
+    sessions_with_content = content_crud.list_session_ids_with_content(db, [s.id for s in sessions])
+
     rebuilt = 0
     deleted = 0
     failed = 0
 
     for session in sessions:
         try:
-            # Check if there is any generated content for the session
-            contents = content_crud.list_for_session(db, session.id)
-            if contents and len(contents) > 0:
+            if session.id in sessions_with_content:
                 # Rebuild documentation only when generated content exists
                 result = DocumentationBuilder.build_documentation(db, session.id)
                 if result is not None:
@@ -1158,23 +1186,26 @@ async def delete_session_documentation(
     return session
 
 
-@router.get("/{session_id}/documentation", response_model=SessionDocumentationResponse)
-async def get_session_documentation(
-    session_id: int,
-    current_user: User = Depends(get_current_user_optional),
-    db: Session = Depends(get_db),
+def _documentation_artifact_response(
+    session: SessionModel | None,
+    current_user: User | None,
+    request: Request,
+    response: Response,
 ):
     """
-    Get published documentation artifact for a session.
+    Return a session's stored documentation artifact with ETag handling.
 
-    Returns the pre-built JSON documentation containing session metadata
-    and all generated content sections (summary, transcription, diagrams, etc.).
+    Shared by the ID- and URI-based documentation endpoints.
 
-    - Published sessions: accessible to anyone
-    - Draft sessions: only accessible to owner
-    - Returns 404 if session not found or artifact not yet generated
+    Args:
+        session: Resolved session, or None if the lookup found nothing
+        current_user: Authenticated user, if any
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (receives cache headers)
+
+    Returns:
+        The artifact dict, or an empty 304 response if the client copy is current
     """
-    session = session_crud.read(db, session_id)
     if not session:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Session not found")
 
@@ -1186,18 +1217,51 @@ async def get_session_documentation(
         )
 
     # Return artifact if available
-    if not session.published_documentation_artifact:
+    artifact = session.published_documentation_artifact
+    if not artifact:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND,
             detail="Documentation artifact not yet generated",
         )
 
-    return session.published_documentation_artifact
+    etag = _documentation_etag(artifact)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, must-revalidate"}
+    if _etag_matches(request, etag):
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    response.headers.update(cache_headers)
+    return artifact
+
+
+@router.get("/{session_id}/documentation", response_model=SessionDocumentationResponse)
+async def get_session_documentation(
+    session_id: int,
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user_optional),
+    db: Session = Depends(get_db),
+):
+    """
+    Get published documentation artifact for a session.
+
+    Returns the pre-built JSON documentation containing session metadata
+    and all generated content sections (summary, transcription, diagrams, etc.).
+
+    - Published sessions: accessible to anyone
+    - Draft sessions: only accessible to owner
+    - Returns 404 if session not found or artifact not yet generated
+    - Returns 304 if If-None-Match matches the artifact's ETag
+    """
+    return _documentation_artifact_response(
+        session_crud.read(db, session_id), current_user, request, response
+    )
 
 
 @router.get("/by-uri/{uri}/documentation", response_model=SessionDocumentationResponse)
 async def get_session_documentation_by_uri(
     uri: str,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user_optional),
     db: Session = Depends(get_db),
 ):
@@ -1209,22 +1273,6 @@ async def get_session_documentation_by_uri(
 
     Returns 404 if session not found or if artifact not yet generated.
     """
-    session = session_crud.read_by_uri(db, uri)
-    if not session:
-        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Session not found")
-
-    # Verify access permissions
-    if not can_access_session_content(session, current_user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied",
-        )
-
-    # Return artifact if available
-    if not session.published_documentation_artifact:
-        raise HTTPException(
-            status_code=HTTP_404_NOT_FOUND,
-            detail="Documentation artifact not yet generated",
-        )
-
-    return session.published_documentation_artifact
+    return _documentation_artifact_response(
+        session_crud.read_by_uri(db, uri), current_user, request, response
+    )
@@ -1,6 +1,10 @@
 """API routes for Session Content Management (sub-resource)."""
 
+import asyncio
 import json
+import os
+import re
+from urllib.parse import quote
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, UploadFile
@@ -42,18 +46,49 @@ logger = structlog.get_logger()
 
 router = APIRouter(prefix="/sessions", tags=["session-content"])
 
+CONTENT_MEDIA_TYPES = {
+    "plain_text": "text/plain; charset=utf-8",
+    "markdown": "text/markdown; charset=utf-8",
+    "json": "application/json",
+    "json_array": "application/json",
+}
+
+CONTENT_FILE_EXTENSIONS = {
+    "plain_text": "txt",
+    "markdown": "md",
+    "json": "json",
+    "json_array": "json",
+}
+
+# Characters that cannot appear inside a quoted-string filename parameter
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\x00-\x1f\x7f"\\]')
+
 
 def _content_media_type(content_type: str | None) -> str:
     normalized = (content_type or "plain_text").strip().lower()
+    return CONTENT_MEDIA_TYPES.get(normalized, "text/plain; charset=utf-8")
+
+
+def _content_disposition(disposition: str, filename: str) -> str:
+    """
+    Build a Content-Disposition header value for a user-supplied filename.
 
-    media_type_map = {
-        "plain_text": "text/plain; charset=utf-8",
-        "markdown": "text/markdown; charset=utf-8",
-        "json": "application/json",
-        "json_array": "application/json",
-    }
+    The plain ``filename`` parameter gets an ASCII-only fallback with quotes,
+    backslashes and control characters replaced, so the header cannot be broken
+    out of. Non-ASCII names are additionally sent as RFC 5987 ``filename*``.
 
-    return media_type_map.get(normalized, "text/plain; charset=utf-8")
+    Args:
+        disposition: Either "attachment" or "inline"
+        filename: Desired download filename
+
+    Returns:
+        str: Header value
+    """
+    fallback = _UNSAFE_FILENAME_CHARS.sub("_", filename.encode("ascii", "replace").decode("ascii"))
+    header = f'{disposition}; filename="{fallback}"'
+    if fallback != filename:
+        header += f"; filename*=UTF-8''{quote(filename, safe='')}"
+    return header
 
 
 def _is_browser_navigation(request: Request) -> bool:
@@ -147,21 +182,14 @@ async def get_content_by_identifier(
         identifier_part = identifier.strip() or "content"
 
         content_type = (db_content.content_type or "plain_text").strip().lower()
-        extension_map = {
-            "plain_text": "txt",
-            "markdown": "md",
-            "json": "json",
-            "json_array": "json",
-        }
-
-        extension = extension_map.get(content_type, "txt")
+        extension = CONTENT_FILE_EXTENSIONS.get(content_type, "txt")
         media_type = _content_media_type(content_type)
         filename = f"{filename_base}-{identifier_part}.{extension}"
 
         return Response(
             content=db_content.content,
             media_type=media_type,
-            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+            headers={"Content-Disposition": _content_disposition("attachment", filename)},
         )
 
     if _is_browser_navigation(request):
@@ -207,22 +235,24 @@ async def create_content(
             detail=f"Content with identifier '{identifier}' already exists. Delete and re-create to update.",
         )
 
-    # Create the content
-    db_content = content_crud.create_content(
-        db=db,
-        session_id=session_id,
-        identifier=identifier,
-        content=content_in.content,
-        content_type=content_in.content_type or "plain_text",
-        workflow_execution_id=None,  # Manually provided
-        meta_info=content_in.meta_info,
-        ai_generated=content_in.ai_generated,
-        editorially_reviewed=content_in.editorially_reviewed,
+    # Create the content and update session's available content in one transaction
+    db_content = session_crud.add_available_content_identifier_with(
+        db,
+        session_id,
+        identifier,
+        lambda: content_crud.create_content(
+            db=db,
+            session_id=session_id,
+            identifier=identifier,
+            content=content_in.content,
+            content_type=content_in.content_type or "plain_text",
+            workflow_execution_id=None,  # Manually provided
+            meta_info=content_in.meta_info,
+            ai_generated=content_in.ai_generated,
+            editorially_reviewed=content_in.editorially_reviewed,
+        ),
     )
 
-    # Update session's available content
-    session_crud.add_available_content_identifier(db, session_id, identifier)
-
     logger.info(
         "content_created",
         session_id=session_id,
@@ -252,6 +282,23 @@ async def update_content(
             detail=f"Content with identifier '{identifier}' not found",
         )
 
+    # Saving without edits is common from the editor; skip the write and commit entirely
+    if (
+        content_in.content == db_content.content
+        and (content_in.meta_info is None or content_in.meta_info == db_content.meta_info)
+        and (
+            content_in.editorially_reviewed is None
+            or content_in.editorially_reviewed == db_content.editorially_reviewed
+        )
+    ):
+        logger.info(
+            "content_update_skipped_unchanged",
+            session_id=session_id,
+            identifier=identifier,
+            content_id=db_content.id,
+        )
+        return db_content
+
     updated = content_crud.update_content(
         db=db,
         content_id=db_content.id,
@@ -357,14 +404,17 @@ async def upload_audio_file(
     Upload a raw audio file for a session (owner only).
 
     The file is stored in S3 immediately. A Celery task is queued to convert
-    it to FLAC chunks. The returned record will have status=pending until
-    the task completes.
+    it to audio chunks in the configured codec (FLAC or Ogg/Opus). The returned
+    record will have status=pending until the task completes.
     """
     if not file.filename:
         raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail="filename is required")
 
-    raw_data = await file.read()
-    if not raw_data:
+    # Measure the spooled upload instead of reading it into memory; it is streamed to S3 below
+    size_bytes = file.size
+    if size_bytes is None:
+        size_bytes = file.file.seek(0, os.SEEK_END)
+    if not size_bytes:
         raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail="Uploaded file is empty")
 
     # Determine file_order: default to count+1 per file uploaded (1-based)
@@ -378,13 +428,17 @@ async def upload_audio_file(
         original_filename=file.filename,
         s3_raw_key="__placeholder__",  # replaced below
         file_order=file_order,
-        total_size_bytes=len(raw_data),
+        total_size_bytes=size_bytes,
         created_by_user_id=current_user.id if current_user else None,
     )
 
     # Upload raw file to S3
     s3 = get_s3_audio_service()
-    raw_key = s3.upload_raw(session_id, record.id, file.filename, raw_data)
+    file.file.seek(0)
+    # boto3 is blocking; keep the event loop free while the upload streams to S3
+    raw_key = await asyncio.to_thread(
+        s3.upload_raw, session_id, record.id, file.filename, file.file, size_bytes
+    )
 
     # Update record with real S3 key
     record.s3_raw_key = raw_key
@@ -399,7 +453,7 @@ async def upload_audio_file(
         session_id=session_id,
         audio_file_id=record.id,
         original_filename=file.filename,
-        size_bytes=len(raw_data),
+        size_bytes=size_bytes,
         file_order=file_order,
     )
 
@@ -456,7 +510,7 @@ async def delete_audio_file(
     s3 = get_s3_audio_service()
     if record.s3_raw_key:
         try:
-            s3.delete_object(record.s3_raw_key)
+            await asyncio.to_thread(s3.delete_object, record.s3_raw_key)
         except Exception:
             logger.warning(
                 "audio_file_delete_s3_raw_failed",
@@ -465,7 +519,7 @@ async def delete_audio_file(
             )
     if record.s3_prefix:
         try:
-            s3.delete_prefix(record.s3_prefix)
+            await asyncio.to_thread(s3.delete_prefix, record.s3_prefix)
         except Exception:
             logger.warning(
                 "audio_file_delete_s3_chunks_failed",
@@ -521,20 +575,24 @@ async def upload_slide_file(
         raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail="Uploaded file is empty")
 
     s3 = get_s3_slide_service()
-    s3_key = s3.upload_slide(session_id, file.filename, data)
-
-    db_content = content_crud.create_content(
-        db=db,
-        session_id=session_id,
-        identifier="slide_deck",
-        content=json.dumps({"s3_key": s3_key, "filename": file.filename, "size": len(data)}),
-        content_type="json",
-        workflow_execution_id=None,
-        meta_info={"filename": file.filename, "size": len(data)},
-        ai_generated=False,
-        editorially_reviewed=False,
+    s3_key = await asyncio.to_thread(s3.upload_slide, session_id, file.filename, data)
+
+    db_content = session_crud.add_available_content_identifier_with(
+        db,
+        session_id,
+        "slide_deck",
+        lambda: content_crud.create_content(
+            db=db,
+            session_id=session_id,
+            identifier="slide_deck",
+            content=json.dumps({"s3_key": s3_key, "filename": file.filename, "size": len(data)}),
+            content_type="json",
+            workflow_execution_id=None,
+            meta_info={"filename": file.filename, "size": len(data)},
+            ai_generated=False,
+            editorially_reviewed=False,
+        ),
     )
-    session_crud.add_available_content_identifier(db, session_id, "slide_deck")
 
     logger.info(
         "slide_file_uploaded",
@@ -547,20 +605,31 @@ async def upload_slide_file(
     return db_content
 
 
-@router.get("/{session_id}/slide-files/download")
-async def download_slide_file(
-    session_id: int,
-    current_user: User = Depends(get_current_user_optional),
-    db: Session = Depends(get_db),
-):
-    """Download the stored slide deck PDF for a session."""
+async def _slide_pdf_response(
+    session_id: int, current_user: User | None, db: Session, event_prefix: str
+) -> Response:
+    """
+    Load a session's slide deck PDF from S3 and wrap it in an inline PDF response.
+
+    Shared by the download and embed endpoints, which differ only in their
+    documentation and log event names.
+
+    Args:
+        session_id: Session ID
+        current_user: Authenticated user, if any
+        db: Database session
+        event_prefix: Prefix for structured log events (e.g. "slide_download")
+
+    Returns:
+        Response: PDF response with inline Content-Disposition
+    """
     db_session = session_crud.read(db, session_id)
     if not db_session:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Session not found")
 
     if not can_access_session_content(db_session, current_user):
         logger.warning(
-            "slide_download_access_denied",
+            f"{event_prefix}_access_denied",
             session_id=session_id,
             status=db_session.status,
             user_id=current_user.id if current_user else None,
@@ -582,10 +651,10 @@ async def download_slide_file(
 
     s3 = get_s3_slide_service()
     try:
-        data = s3.download_slide(s3_key)
+        data = await asyncio.to_thread(s3.download_slide, s3_key)
     except Exception as exc:
         logger.error(
-            "slide_download_failed",
+            f"{event_prefix}_failed",
             session_id=session_id,
             s3_key=s3_key,
             error=str(exc),
@@ -599,10 +668,20 @@ async def download_slide_file(
     return Response(
         content=data,
         media_type="application/pdf",
-        headers={"Content-Disposition": f'inline; filename="{safe_filename}"'},
+        headers={"Content-Disposition": _content_disposition("inline", safe_filename)},
     )
 
 
+@router.get("/{session_id}/slide-files/download")
+async def download_slide_file(
+    session_id: int,
+    current_user: User = Depends(get_current_user_optional),
+    db: Session = Depends(get_db),
+):
+    """Download the stored slide deck PDF for a session."""
+    return await _slide_pdf_response(session_id, current_user, db, "slide_download")
+
+
 @router.get("/{session_id}/slide-files/embed")
 async def embed_slide_file(
     session_id: int,
@@ -617,51 +696,4 @@ async def embed_slide_file(
     by the hub frontend. Note that a reverse proxy must also not inject
     frame-denying headers.
     """
-    # Reuse the same logic as download_slide_file to enforce access rules
-    db_session = session_crud.read(db, session_id)
-    if not db_session:
-        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Session not found")
-
-    if not can_access_session_content(db_session, current_user):
-        logger.warning(
-            "slide_embed_access_denied",
-            session_id=session_id,
-            status=db_session.status,
-            user_id=current_user.id if current_user else None,
-        )
-        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Session not found")
-
-    db_content = content_crud.get_content_by_identifier(db, session_id, "slide_deck")
-    if not db_content:
-        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Slide deck not found")
-
-    payload = _parse_slide_payload(db_content.content)
-    s3_key = payload.get("s3_key") if payload else None
-    filename = payload.get("filename") if payload else None
-    if not isinstance(s3_key, str) or not s3_key.strip():
-        raise HTTPException(
-            status_code=HTTP_404_NOT_FOUND,
-            detail="Slide deck metadata is missing S3 key",
-        )
-
-    s3 = get_s3_slide_service()
-    try:
-        data = s3.download_slide(s3_key)
-    except Exception as exc:
-        logger.error(
-            "slide_embed_failed",
-            session_id=session_id,
-            s3_key=s3_key,
-            error=str(exc),
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=HTTP_404_NOT_FOUND, detail="Slide deck file not found"
-        ) from exc
-
-    safe_filename = filename if isinstance(filename, str) and filename.strip() else "slides.pdf"
-    return Response(
-        content=data,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'inline; filename="{safe_filename}"'},
-    )
+    return await _slide_pdf_response(session_id, current_user, db, "slide_embed")
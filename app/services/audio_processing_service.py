@@ -1,9 +1,9 @@
-"""Audio processing service: converts raw uploads to FLAC chunks via ffmpeg."""
+"""Audio processing service: converts raw uploads to FLAC (or Opus) chunks via ffmpeg."""
 
 import os
 import subprocess
 import tempfile
-from pathlib import Path
+from functools import cache
 
 import structlog
 
@@ -11,32 +11,74 @@ from app.config.settings import get_settings
 
 logger = structlog.get_logger()
 
+# Chunk file extension per AUDIO_CHUNK_CODEC
+CHUNK_EXTENSIONS: dict[str, str] = {"flac": "flac", "opus": "ogg"}
+# ffmpeg encoder required per AUDIO_CHUNK_CODEC
+CHUNK_ENCODERS: dict[str, str] = {"flac": "flac", "opus": "libopus"}
+
 
 class AudioProcessingError(Exception):
     """Raised when ffmpeg processing fails."""
 
 
+@cache
+def ffmpeg_has_encoder(encoder: str) -> bool:
+    """Return whether the local ffmpeg build provides `encoder` (probed once per process)."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-nostdin", "-hide_banner", "-encoders"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    # Encoder lines look like " A....D libopus    libopus Opus"
+    return any(
+        len(fields) > 1 and fields[1] == encoder
+        for fields in (line.split() for line in result.stdout.splitlines())
+    )
+
+
 class AudioProcessingService:
     """
-    Converts raw audio files to time-based FLAC chunks using ffmpeg.
+    Converts raw audio files to time-based FLAC or Ogg/Opus chunks using ffmpeg.
 
     Each chunk is <= `max_file_size_mb` MB and spans `segment_seconds` seconds.
     The service uses temporary files so nothing is written to persistent storage.
+    With AUDIO_CHUNK_CODEC=opus the chunks are Ogg/Opus instead, which Whisper
+    accepts and which is roughly an order of magnitude smaller to upload. If the
+    local ffmpeg has no libopus encoder, the service falls back to FLAC.
     """
 
     def __init__(self) -> None:
         settings = get_settings()
         self.compression_level: int = settings.audio_flac_compression_level
+        self.codec: str = settings.audio_chunk_codec
+        self.opus_bitrate: str = settings.audio_opus_bitrate
+        if self.codec not in CHUNK_EXTENSIONS:
+            raise AudioProcessingError(f"Unsupported AUDIO_CHUNK_CODEC '{self.codec}'")
+        if self.codec != "flac" and not ffmpeg_has_encoder(CHUNK_ENCODERS[self.codec]):
+            logger.warning(
+                "audio_chunk_codec_unavailable",
+                codec=self.codec,
+                encoder=CHUNK_ENCODERS[self.codec],
+                fallback="flac",
+            )
+            self.codec = "flac"
+        self.chunk_extension: str = CHUNK_EXTENSIONS[self.codec]
         self.segment_seconds: int = settings.transcribe_segment_seconds
         self.max_file_size_mb: int = settings.transcribe_max_file_size_mb
+        self.tmp_dir: str | None = settings.audio_processing_tmp_dir or None
 
     def process(self, raw_data: bytes, original_filename: str) -> list[bytes]:
         """
-        Convert raw audio bytes to a list of FLAC chunk byte blobs.
+        Convert raw audio bytes to a list of audio chunk byte blobs.
 
         Steps:
-        1. Write raw bytes to a temp input file.
-        2. Run ffmpeg to segment into FLAC chunks inside a temp output dir.
+        1. Write raw bytes to a temp input file (under AUDIO_PROCESSING_TMP_DIR if set).
+        2. Run ffmpeg to segment into FLAC/Opus chunks inside a temp output dir.
         3. Read chunk files in order and return their bytes.
         4. Clean up temp files.
 
@@ -45,7 +87,7 @@ class AudioProcessingService:
             original_filename: Original filename (used to infer format hint for ffmpeg).
 
         Returns:
-            List of FLAC chunk bytes, ordered by time.
+            List of chunk bytes (format per `chunk_extension`), ordered by time.
 
         Raises:
             AudioProcessingError: If ffmpeg exits non-zero.
@@ -56,9 +98,9 @@ class AudioProcessingService:
             else ".bin"
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with tempfile.TemporaryDirectory(dir=self.tmp_dir) as tmpdir:
             input_path = os.path.join(tmpdir, f"input{suffix}")
-            output_pattern = os.path.join(tmpdir, "chunk_%04d.flac")
+            output_pattern = os.path.join(tmpdir, f"chunk_%04d.{self.chunk_extension}")
 
             # Write raw input
             with open(input_path, "wb") as f:
@@ -67,21 +109,33 @@ class AudioProcessingService:
             # Run ffmpeg segmentation
             self._run_ffmpeg(input_path, output_pattern)
 
-            # Collect output chunks in sorted order
-            chunk_files = sorted(Path(tmpdir).glob("chunk_*.flac"))
+            # Collect output chunks in sorted order. scandir reuses the d_type from
+            # the directory listing, so filtering needs no extra stat per entry.
+            with os.scandir(tmpdir) as entries:
+                chunk_files = sorted(
+                    (
+                        entry
+                        for entry in entries
+                        if entry.name.startswith("chunk_")
+                        and entry.name.endswith(f".{self.chunk_extension}")
+                        and entry.is_file(follow_symlinks=False)
+                    ),
+                    key=lambda entry: entry.name,
+                )
             if not chunk_files:
                 raise AudioProcessingError(
                     f"ffmpeg produced no output chunks for '{original_filename}'"
                 )
 
             chunks = []
-            for chunk_path in chunk_files:
-                chunk_bytes = chunk_path.read_bytes()
+            for chunk_entry in chunk_files:
+                with open(chunk_entry.path, "rb") as f:
+                    chunk_bytes = f.read()
                 size_mb = len(chunk_bytes) / (1024 * 1024)
                 if size_mb > self.max_file_size_mb:
                     logger.warning(
                         "audio_chunk_exceeds_size_limit",
-                        chunk_file=chunk_path.name,
+                        chunk_file=chunk_entry.name,
                         size_mb=round(size_mb, 2),
                         max_size_mb=self.max_file_size_mb,
                     )
@@ -96,21 +150,30 @@ class AudioProcessingService:
             return chunks
 
     def _run_ffmpeg(self, input_path: str, output_pattern: str) -> None:
-        """Run ffmpeg to segment audio into FLAC chunks."""
+        """Run ffmpeg to segment audio into FLAC or Opus chunks."""
+        if self.codec == "opus":
+            # voip tuning favours speech intelligibility at low bitrates
+            codec_args = ["-c:a", "libopus", "-b:a", self.opus_bitrate, "-application", "voip"]
+        else:
+            codec_args = ["-c:a", "flac", "-compression_level", str(self.compression_level)]
+
         cmd = [
             "ffmpeg",
+            "-nostdin",  # never wait on stdin inside a worker
+            "-hide_banner",
+            "-loglevel",
+            "error",  # stderr only carries diagnostics, not per-frame progress
             "-y",  # overwrite outputs
             "-i",
             input_path,
+            "-threads",
+            "0",  # let ffmpeg size its thread pool to the available cores
             "-vn",  # drop video streams
             "-ar",
             "16000",  # 16 kHz (optimal for Whisper)
             "-ac",
             "1",  # mono
-            "-c:a",
-            "flac",
-            "-compression_level",
-            str(self.compression_level),
+            *codec_args,
             "-f",
             "segment",
             "-segment_time",
@@ -124,12 +187,13 @@ class AudioProcessingService:
             "ffmpeg_starting",
             input_path=input_path,
             segment_seconds=self.segment_seconds,
-            compression_level=self.compression_level,
+            codec=self.codec,
         )
 
         result = subprocess.run(
             cmd,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             timeout=600,  # 10 min hard limit
         )
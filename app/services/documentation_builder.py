@@ -19,7 +19,20 @@ logger = structlog.get_logger()
 TRANSCRIPTION_IDENTIFIER = "transcription"
 SLIDE_DECK_IDENTIFIER = "slide_deck"
 URL_SECTION_TYPES = {"resource_link", "image", "image_url"}
+SECTION_TITLES = {
+    "summary": "Summary",
+    "key_takeaways": "Key Takeaways",
+    "qna": "Audience Q&A",
+    "glossary": "Concept Glossary",
+    "diagram": "Diagram",
+    "transcription": "Transcription",
+    "tags": "Tags",
+    "key_points": "Key Points",
+    "next_steps": "Next Steps",
+    "questions": "Questions",
+}
 settings = get_settings()
+SESSIONS_API_BASE_URL = f"{settings.api_base_url.rstrip('/')}/api/v2/sessions"
 
 
 class DocumentationBuilder:
@@ -153,14 +166,14 @@ class DocumentationBuilder:
             # Avoid embedding very large transcription blobs in the artifact payload.
             section_type = "resource_link"
             section_resource_url = (
-                f"{settings.api_base_url.rstrip('/')}/api/v2/sessions/{session_id}/content/"
-                f"{TRANSCRIPTION_IDENTIFIER}"
+                f"{SESSIONS_API_BASE_URL}/{session_id}/content/{TRANSCRIPTION_IDENTIFIER}"
             )
             section_content = None
         elif content.identifier == SLIDE_DECK_IDENTIFIER:
             section_type = "resource_link"
-            section_resource_url = f"{settings.api_base_url.rstrip('/')}/api/v2/sessions/{session_id}/slide-files/download"
-            section_embed_url = f"{settings.api_base_url.rstrip('/')}/api/v2/sessions/{session_id}/slide-files/embed"
+            slide_files_url = f"{SESSIONS_API_BASE_URL}/{session_id}/slide-files"
+            section_resource_url = f"{slide_files_url}/download"
+            section_embed_url = f"{slide_files_url}/embed"
             section_content = None
         elif section_type in URL_SECTION_TYPES:
             section_resource_url = _extract_resource_url(content.content, content.meta_info)
@@ -193,19 +206,7 @@ class DocumentationBuilder:
 
 def _get_section_title(identifier: str) -> str:
     """Convert identifier to human-readable title."""
-    title_map = {
-        "summary": "Summary",
-        "key_takeaways": "Key Takeaways",
-        "qna": "Audience Q&A",
-        "glossary": "Concept Glossary",
-        "diagram": "Diagram",
-        "transcription": "Transcription",
-        "tags": "Tags",
-        "key_points": "Key Points",
-        "next_steps": "Next Steps",
-        "questions": "Questions",
-    }
-    return title_map.get(identifier, identifier.replace("_", " ").title())
+    return SECTION_TITLES.get(identifier, identifier.replace("_", " ").title())
 
 
 def _extract_resource_url(content: str | None, meta_info: dict | None) -> str | None:
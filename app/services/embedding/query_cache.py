@@ -5,8 +5,8 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import hashlib
-import json
 
+import orjson
 import redis as redis_sync
 import structlog
 
@@ -79,7 +79,7 @@ class EmbeddingQueryCache:
         cache_key = self._build_cache_key(query_text)
         try:
             await asyncio.to_thread(
-                self._client.set, cache_key, json.dumps(embedding), ex=self.ttl_seconds
+                self._client.set, cache_key, orjson.dumps(embedding), ex=self.ttl_seconds
             )
         except Exception as exc:
             logger.warning("embedding_query_cache_set_failed", error=str(exc))
@@ -95,11 +95,11 @@ class EmbeddingQueryCache:
         return f"embedding_query:{digest}"
 
     @staticmethod
-    def _deserialize_embedding(payload: str) -> list[float] | None:
+    def _deserialize_embedding(payload: str | bytes) -> list[float] | None:
         """Decode a cached embedding payload."""
         try:
-            value = json.loads(payload)
-        except json.JSONDecodeError:
+            value = orjson.loads(payload)
+        except orjson.JSONDecodeError:
             return None
 
         if not isinstance(value, list):
@@ -177,10 +177,10 @@ class ImageGenerationService:
                     "error": f"Image data missing base64 content. Available keys: {available_keys}",
                 }
 
-            save_path.mkdir(parents=True, exist_ok=True)
-
-            if not save_path.exists():
-                return {"success": False, "error": f"Failed to create directory {save_path}"}
+            try:
+                save_path.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                return {"success": False, "error": f"Failed to create directory {save_path}: {e!s}"}
 
             try:
                 image_bytes = base64.b64decode(base64_data)
@@ -336,8 +336,6 @@ class ImageGenerationService:
 
                         if image_data:
                             # Convert binary data to base64 for consistency with other methods
-                            import base64
-
                             base64_data = base64.b64encode(image_data).decode("utf-8")
 
                             # Verify the base64 encoding is valid by decoding it back
@@ -470,8 +468,6 @@ class ImageGenerationService:
                 return False, None, "Invalid PNG data received"
 
         # Convert binary data to base64 for consistency
-        import base64
-
         base64_data = base64.b64encode(image_data).decode("utf-8")
 
         # Verify the base64 encoding is valid
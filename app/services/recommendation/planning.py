@@ -90,6 +90,19 @@ class RecommendationPlanner:
             return True
         return min_gap_minutes <= max_gap_minutes
 
+    @staticmethod
+    def _compute_combined_score(
+        session_id: int,
+        overall_score: float,
+        diversity_scores: dict[int, float] | None,
+        diversity_weight: float,
+    ) -> float:
+        """Compute combined score for ranking, optionally weighted by diversity."""
+        if diversity_weight <= 0.0 or not diversity_scores:
+            return overall_score
+        diversity_score = diversity_scores.get(session_id, 0.0)
+        return (1.0 - diversity_weight) * overall_score + diversity_weight * diversity_score
+
     def optimize_session_plan(
         self,
         recommendations: list[tuple],
@@ -110,17 +123,12 @@ class RecommendationPlanner:
         if not recommendations:
             return []
 
-        def _compute_combined_score(session_id: int, overall_score: float) -> float:
-            """Compute combined score for ranking, optionally weighted by diversity."""
-            if diversity_weight <= 0.0 or not diversity_scores:
-                return overall_score
-            diversity_score = diversity_scores.get(session_id, 0.0)
-            return (1.0 - diversity_weight) * overall_score + diversity_weight * diversity_score
-
         ranked_candidates = sorted(
             recommendations,
             key=lambda item: (
-                -_compute_combined_score(item[0].id, item[1]["overall_score"]),
+                -self._compute_combined_score(
+                    item[0].id, item[1]["overall_score"], diversity_scores, diversity_weight
+                ),
                 item[0].start_datetime,
                 item[0].end_datetime,
                 item[0].id,
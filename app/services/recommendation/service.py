@@ -3,6 +3,7 @@
 Keeps recommendation flow and ranking logic isolated from search-only services.
 """
 
+import heapq
 from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from time import perf_counter
@@ -1711,9 +1712,9 @@ class RecommendationService:
             params.preference_dominance_margin,
         )
         recommendations = self._apply_score_threshold(recommendations, params.min_overall_score)
-        recommendations.sort(key=lambda x: x[1]["overall_score"], reverse=True)
 
         if params.diversity_weight > 0:
+            recommendations.sort(key=lambda x: x[1]["overall_score"], reverse=True)
             return self.diversity_optimizer.diversify_results(
                 candidates=recommendations,
                 limit=limit,
@@ -1723,7 +1724,8 @@ class RecommendationService:
                 language=params.language,
             )
 
-        top = recommendations[:limit]
+        # Only the first page is returned, so select it without sorting the full list
+        top = heapq.nlargest(limit, recommendations, key=lambda x: x[1]["overall_score"])
         for _, scores in top:
             scores["diversity_score"] = None
         return top
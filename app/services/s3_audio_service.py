@@ -1,4 +1,7 @@
-"""S3 service for audio file storage (raw uploads and processed FLAC chunks)."""
+"""S3 service for audio file storage (raw uploads and processed FLAC/Opus chunks)."""
+
+from functools import lru_cache
+from typing import BinaryIO, ClassVar
 
 import structlog
 
@@ -17,6 +20,8 @@ class S3AudioService(S3Service):
 
     RAW_PREFIX = "content/summaraizer/audio/raw"
     CHUNKS_PREFIX = "content/summaraizer/audio/chunks"
+    # Content types of processed chunks by file extension
+    CHUNK_CONTENT_TYPES: ClassVar[dict[str, str]] = {"flac": "audio/flac", "ogg": "audio/ogg"}
 
     def raw_s3_key(self, session_id: int, audio_file_id: int, original_filename: str) -> str:
         """S3 key for a raw uploaded audio file."""
@@ -24,43 +29,70 @@ class S3AudioService(S3Service):
         return f"{self.RAW_PREFIX}/session_{session_id}/{audio_file_id}.{suffix}"
 
     def chunk_s3_prefix(self, session_id: int, audio_file_id: int) -> str:
-        """S3 key prefix for processed FLAC chunks of an audio file."""
+        """S3 key prefix for processed chunks of an audio file."""
         return f"{self.CHUNKS_PREFIX}/session_{session_id}/audio_{audio_file_id}/"
 
-    def chunk_s3_key(self, session_id: int, audio_file_id: int, chunk_index: int) -> str:
-        """S3 key for a single FLAC chunk."""
-        return f"{self.chunk_s3_prefix(session_id, audio_file_id)}{chunk_index:04d}.flac"
+    def chunk_s3_key(
+        self, session_id: int, audio_file_id: int, chunk_index: int, extension: str = "flac"
+    ) -> str:
+        """S3 key for a single processed chunk."""
+        return f"{self.chunk_s3_prefix(session_id, audio_file_id)}{chunk_index:04d}.{extension}"
 
     def upload_raw(
-        self, session_id: int, audio_file_id: int, original_filename: str, data: bytes
+        self,
+        session_id: int,
+        audio_file_id: int,
+        original_filename: str,
+        fileobj: BinaryIO,
+        size_bytes: int,
     ) -> str:
-        """Upload a raw audio file to S3 and return the S3 key."""
+        """
+        Stream a raw audio file to S3 and return the S3 key.
+
+        Uses upload_fileobj so large recordings are sent in multipart chunks
+        straight from the spooled upload file instead of being copied into memory.
+
+        Args:
+            session_id: Session ID
+            audio_file_id: SessionAudioFile ID
+            original_filename: Original filename (determines the key suffix)
+            fileobj: Readable binary file object positioned at the start
+            size_bytes: Total size of the file (for logging)
+
+        Returns:
+            str: S3 key of the uploaded object
+        """
         key = self.raw_s3_key(session_id, audio_file_id, original_filename)
-        self.s3_client.put_object(
-            Bucket=self.bucket,
-            Key=key,
-            Body=data,
-            ContentType="application/octet-stream",
+        self.s3_client.upload_fileobj(
+            fileobj,
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": "application/octet-stream"},
         )
         logger.info(
             "audio_raw_uploaded_to_s3",
             session_id=session_id,
             audio_file_id=audio_file_id,
             s3_key=key,
-            size_bytes=len(data),
+            size_bytes=size_bytes,
         )
         return key
 
     def upload_chunk(
-        self, session_id: int, audio_file_id: int, chunk_index: int, data: bytes
+        self,
+        session_id: int,
+        audio_file_id: int,
+        chunk_index: int,
+        data: bytes,
+        extension: str = "flac",
     ) -> str:
-        """Upload a processed FLAC chunk to S3 and return the S3 key."""
-        key = self.chunk_s3_key(session_id, audio_file_id, chunk_index)
+        """Upload a processed chunk (FLAC by default) to S3 and return the S3 key."""
+        key = self.chunk_s3_key(session_id, audio_file_id, chunk_index, extension)
         self.s3_client.put_object(
             Bucket=self.bucket,
             Key=key,
             Body=data,
-            ContentType="audio/flac",
+            ContentType=self.CHUNK_CONTENT_TYPES.get(extension, "application/octet-stream"),
         )
         logger.info(
             "audio_chunk_uploaded_to_s3",
@@ -80,7 +112,7 @@ class S3AudioService(S3Service):
         return data
 
     def download_chunk(self, s3_key: str) -> bytes:
-        """Download a single FLAC chunk from S3."""
+        """Download a single processed chunk from S3."""
         response = self.s3_client.get_object(Bucket=self.bucket, Key=s3_key)
         return response["Body"].read()
 
@@ -115,6 +147,12 @@ class S3AudioService(S3Service):
         return deleted
 
 
+@lru_cache(maxsize=1)
 def get_s3_audio_service() -> S3AudioService:
-    """Dependency-injectable factory for S3AudioService."""
+    """Dependency-injectable factory for S3AudioService.
+
+    The instance (and its lazily created boto3 client, whose creation is guarded
+    by a lock) is shared per process so connection pools are reused across
+    requests and tasks.
+    """
     return S3AudioService()
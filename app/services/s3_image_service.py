@@ -1,5 +1,6 @@
 """S3 image storage service for generated images."""
 
+import base64
 from datetime import datetime
 
 import structlog
@@ -25,8 +26,6 @@ class S3ImageService(S3Service):
     ) -> str:
         """Upload a base64-encoded image to S3 and return the public URL."""
         try:
-            import base64
-
             image_bytes = base64.b64decode(base64_data)
 
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -1,5 +1,7 @@
 """Shared S3 service primitives."""
 
+import threading
+
 import boto3
 import structlog
 
@@ -33,6 +35,7 @@ class S3Service:
             )
 
         self._s3_client = None
+        self._s3_client_lock = threading.Lock()
 
         logger.info(
             "s3_service_initialized",
@@ -43,16 +46,23 @@ class S3Service:
 
     @property
     def s3_client(self):
-        """Lazy initialization of the boto3 S3 client on first use."""
+        """Lazy initialization of the boto3 S3 client on first use.
+
+        Creating a client on boto3's default session is not thread-safe, and the
+        first use may happen concurrently in worker threads, so creation is
+        serialized. The finished client itself is safe to share.
+        """
         if self._s3_client is None:
-            self._s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=self.access_key,
-                aws_secret_access_key=self.secret_key,
-                region_name=self.region,
-                endpoint_url=self.endpoint_url,
-                config=boto3.session.Config(
-                    s3={"addressing_style": "path" if self.use_path_style else "virtual"}
-                ),
-            )
+            with self._s3_client_lock:
+                if self._s3_client is None:
+                    self._s3_client = boto3.client(
+                        "s3",
+                        aws_access_key_id=self.access_key,
+                        aws_secret_access_key=self.secret_key,
+                        region_name=self.region,
+                        endpoint_url=self.endpoint_url,
+                        config=boto3.session.Config(
+                            s3={"addressing_style": "path" if self.use_path_style else "virtual"}
+                        ),
+                    )
         return self._s3_client
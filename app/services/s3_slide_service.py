@@ -1,5 +1,7 @@
 """S3 service for PDF slide deck storage."""
 
+from functools import lru_cache
+
 import structlog
 
 from app.services.s3_service import S3Service
@@ -53,5 +55,7 @@ class S3SlideService(S3Service):
         return f"{base}/{s3_key.lstrip('/')}"
 
 
+@lru_cache(maxsize=1)
 def get_s3_slide_service() -> S3SlideService:
+    """Dependency-injectable factory for S3SlideService (one instance per process)."""
     return S3SlideService()
@@ -1,7 +1,7 @@
 import io
 import re
 import zipfile
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 
 from bs4 import BeautifulSoup
 from markdown_it import MarkdownIt
@@ -9,9 +9,18 @@ from markdown_it import MarkdownIt
 from app.crud.generated_content import (
     get_content_by_identifier as get_generated_content_by_identifier,
 )
-from app.database.models import Event
+from app.crud.generated_content import get_latest_contents_for_sessions
+from app.database.models import Event, GeneratedContent
 from app.database.models import Session as SessionModel
 
+_EXPORTED_IDENTIFIERS = ["summary", "transcription"]
+
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([,.:;?!%])")
+
+# Parser configuration is immutable after construction, so one instance serves all renders
+_MARKDOWN = MarkdownIt()
+
 
 def markdown_to_text(md_text: str) -> str:
     """Convert Markdown to nicely formatted plain text.
@@ -23,24 +32,24 @@ def markdown_to_text(md_text: str) -> str:
     if not md_text:
         return "\n"
 
-    md_it = MarkdownIt()
-    html = md_it.render(md_text)
+    html = _MARKDOWN.render(md_text)
 
     soup = BeautifulSoup(html, "html.parser")
 
     out = _render_children(soup).strip()
     # Normalize excessive blank lines
-    out = re.sub(r"\n{3,}", "\n\n", out)
+    out = _BLANK_LINES_RE.sub("\n\n", out)
     return out.strip() + "\n"
 
 
 def _fix_punctuation_spacing(text: str) -> str:
     # Remove spaces before common punctuation characters introduced by
     # joining inline elements with separators.
-    return re.sub(r"\s+([,.:;?!%])", r"\1", text)
+    return _SPACE_BEFORE_PUNCT_RE.sub(r"\1", text)
 
 
 def _render_children(node, _indent: int = 0) -> str:
+    # Empty renders are skipped on the way in so the pieces can be joined directly
     pieces: list[str] = []
     for child in node.children:
         if getattr(child, "name", None) is None:
@@ -48,8 +57,10 @@ def _render_children(node, _indent: int = 0) -> str:
             if txt.strip():
                 pieces.append(txt)
             continue
-        pieces.append(_render_node(child, _indent))
-    return "\n".join([p for p in pieces if p])
+        rendered = _render_node(child, _indent)
+        if rendered:
+            pieces.append(rendered)
+    return "\n".join(pieces)
 
 
 def _render_heading(node, _indent: int = 0) -> str:
@@ -68,26 +79,21 @@ def _render_paragraph(node, _indent: int = 0) -> str:
     return inner + "\n"
 
 
-def _render_ul(node, _indent: int = 0) -> str:
+def _render_list(node, _indent: int = 0, ordered: bool = False) -> str:
     lines: list[str] = []
-    for li in node.find_all("li", recursive=False):
-        item = _render_li(li, _indent, "- ")
+    for idx, li in enumerate(node.find_all("li", recursive=False), start=1):
+        item = _render_li(li, _indent, f"{idx}. " if ordered else "- ")
         if item:
-            for line in item.splitlines():
-                lines.append(line)
+            lines.extend(item.splitlines())
     return "\n".join(lines) + ("\n" if lines else "")
 
 
+def _render_ul(node, _indent: int = 0) -> str:
+    return _render_list(node, _indent)
+
+
 def _render_ol(node, _indent: int = 0) -> str:
-    lines: list[str] = []
-    idx = 1
-    for li in node.find_all("li", recursive=False):
-        item = _render_li(li, _indent, f"{idx}. ")
-        if item:
-            for line in item.splitlines():
-                lines.append(line)
-        idx += 1
-    return "\n".join(lines) + ("\n" if lines else "")
+    return _render_list(node, _indent, ordered=True)
 
 
 def _render_blockquote(node, _indent: int = 0) -> str:
@@ -140,9 +146,10 @@ def _render_li(node, _indent: int = 0, marker: str = "- ") -> str:
     main_text = " ".join(main_parts).strip()
     if main_text:
         main_text = _fix_punctuation_spacing(main_text)
+        first_prefix = " " * _indent + marker
+        continuation_prefix = " " * (_indent + len(marker))
         for i, ln in enumerate(main_text.splitlines()):
-            prefix = (" " * _indent) + (marker if i == 0 else " " * len(marker))
-            lines.append(prefix + ln)
+            lines.append((first_prefix if i == 0 else continuation_prefix) + ln)
 
     for name, nested_node in nested_nodes:
         if name == "ul":
@@ -152,8 +159,7 @@ def _render_li(node, _indent: int = 0, marker: str = "- ") -> str:
         else:
             nested = _render_children(nested_node, _indent + 2)
         if nested:
-            for ln in nested.splitlines():
-                lines.append(ln)
+            lines.extend(nested.splitlines())
 
     return "\n".join(lines) + ("\n" if lines else "")
 
@@ -237,35 +243,34 @@ def _location_str(obj: SessionModel) -> str | None:
     return ", ".join(parts) if parts else None
 
 
+def _format_str(obj: SessionModel) -> str | None:
+    return _fmt_value(getattr(obj, "session_format", None))
+
+
+def _language_str(obj: SessionModel) -> str | None:
+    return getattr(obj, "language", None)
+
+
+# Metadata header lines in output order: (label, value getter)
+_METADATA_FIELDS: tuple[tuple[str, Callable[[SessionModel], str | None]], ...] = (
+    ("Format", _format_str),
+    ("Tags", _tags_str),
+    ("Sprache", _language_str),
+    ("Referent:innen", _speakers_str),
+    ("Zeitfenster", _timeframe),
+    ("Ort", _location_str),
+)
+
+
 def session_metadata_header(s_obj: SessionModel) -> str:
     """Return a small YAML-like metadata header for a session or empty string."""
-    fmt = getattr(s_obj, "session_format", None)
-    fmt_val = _fmt_value(fmt)
-    tags_str = _tags_str(s_obj)
-    speakers_str = _speakers_str(s_obj)
-    timeframe_formatted = _timeframe(s_obj)
-    location_str = _location_str(s_obj)
-    language = getattr(s_obj, "language", None)
-
-    meta_lines: list[str] = ["---"]
-    if fmt_val:
-        meta_lines.append(f"Format: {fmt_val}")
-    if tags_str:
-        meta_lines.append(f"Tags: {tags_str}")
-    if language:
-        meta_lines.append(f"Sprache: {language}")
-    if speakers_str:
-        meta_lines.append(f"Referent:innen: {speakers_str}")
-    if timeframe_formatted:
-        meta_lines.append(f"Zeitfenster: {timeframe_formatted}")
-    if location_str:
-        meta_lines.append(f"Ort: {location_str}")
-
-    if len(meta_lines) == 1:
+    meta_lines = [
+        f"{label}: {value}" for label, getter in _METADATA_FIELDS if (value := getter(s_obj))
+    ]
+    if not meta_lines:
         return ""
 
-    meta_lines.append("---\n")
-    return "\n".join(meta_lines)
+    return "\n".join(["---", *meta_lines, "---\n"])
 
 
 def add_session_files(
@@ -275,15 +280,24 @@ def add_session_files(
     db_s,
     include_metadata: bool = True,
     plain_text: bool = False,
+    contents: dict[tuple[int, str], GeneratedContent] | None = None,
 ) -> None:
-    """Add summary and transcription files for a single session into the provided ZipFile."""
+    """Add summary and transcription files for a single session into the provided ZipFile.
+
+    `contents` is an optional prefetched (session_id, identifier) map; without it the
+    summary and transcription are queried individually.
+    """
     event_part = event_obj.uri or f"event-{event_obj.id}"
     session_part = s_obj.uri or f"session-{s_obj.id}"
     base_path = f"{event_part}/{session_part}/"
 
     # Summary
     summary_text = None
-    gen = get_generated_content_by_identifier(db_s, s_obj.id, "summary")
+    gen = (
+        contents.get((s_obj.id, "summary"))
+        if contents is not None
+        else get_generated_content_by_identifier(db_s, s_obj.id, "summary")
+    )
     if gen:
         summary_text = gen.content
 
@@ -296,7 +310,11 @@ def add_session_files(
             zf.writestr(base_path + "summary.md", header + summary_text)
 
     # Transcription
-    gen_t = get_generated_content_by_identifier(db_s, s_obj.id, "transcription")
+    gen_t = (
+        contents.get((s_obj.id, "transcription"))
+        if contents is not None
+        else get_generated_content_by_identifier(db_s, s_obj.id, "transcription")
+    )
     if gen_t and gen_t.content:
         zf.writestr(base_path + "transcript.txt", gen_t.content)
 
@@ -309,10 +327,16 @@ def build_zip_bytes(
     plain_text: bool = False,
 ) -> bytes:
     """Build a ZIP archive bytes containing session summaries and transcriptions."""
+    sessions_list = list(sessions_list)
+    # One query for all summaries and transcriptions instead of two per session
+    contents = get_latest_contents_for_sessions(
+        db_s, [s.id for s in sessions_list], _EXPORTED_IDENTIFIERS
+    )
+
     buf = io.BytesIO()
     with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
         for s in sessions_list:
-            add_session_files(zf, event_obj, s, db_s, include_metadata, plain_text)
+            add_session_files(zf, event_obj, s, db_s, include_metadata, plain_text, contents)
 
         # Build top-level index markdown listing included sessions and links
         event_part = event_obj.uri or f"event-{event_obj.id}"
@@ -1,15 +1,18 @@
-"""Whisper API transcription provider — uses processed FLAC chunks from S3."""
+"""Whisper API transcription provider — uses processed FLAC or Ogg/Opus chunks from S3."""
 
 import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 import structlog
+from requests.adapters import HTTPAdapter
 from sqlalchemy.orm import Session as SQLSession
 
 from app.config.settings import get_settings
 from app.database.models import AudioFileProcessingStatus
 from app.services.provider_request_control import perform_rate_limited_request
-from app.services.s3_audio_service import get_s3_audio_service
+from app.services.s3_audio_service import S3AudioService, get_s3_audio_service
 from app.services.transcription.exceptions import (
     TranscriptionPendingError,
     TranscriptionUnavailableError,
@@ -18,13 +21,33 @@ from app.services.transcription.exceptions import (
 logger = structlog.get_logger()
 
 
+# requests.Session is not documented as thread-safe (it carries mutable cookie and
+# adapter state), so each worker thread of the chunk pool in `transcribe` keeps its own
+# session. Sessions are still reused across chunks handled by the same thread, which
+# keeps keep-alive TCP/TLS connections warm without sharing state between threads.
+_thread_local = threading.local()
+
+
+def _whisper_http_session() -> requests.Session:
+    """Per-thread HTTP session so chunk uploads reuse keep-alive TCP/TLS connections."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _thread_local.session = session
+    return session
+
+
 class WhisperTranscriptionProvider:
     """
     Transcribes audio using an OpenAI-compatible Whisper endpoint.
 
-    Audio chunks are downloaded from S3 (processed FLAC) and sent to
-    `{LLM_BASE_URL}/audio/transcriptions` one by one. The results are
-    concatenated in file_order → chunk index order.
+    Audio chunks are downloaded from S3 (processed FLAC or Ogg/Opus, per
+    AUDIO_CHUNK_CODEC) and sent to `{LLM_BASE_URL}/audio/transcriptions`
+    concurrently (bounded by TRANSCRIBE_MAX_WORKERS). The results are concatenated in
+    file_order → chunk index order.
     """
 
     def can_handle(self, session_id: int, db: SQLSession, context: dict) -> bool:
@@ -67,10 +90,11 @@ class WhisperTranscriptionProvider:
 
     def transcribe(self, session_id: int, db: SQLSession, context: dict) -> str:  # noqa: ARG002
         """
-        Download all FLAC chunks for the session and transcribe via Whisper.
+        Download all audio chunks for the session and transcribe via Whisper.
 
-        Files are processed in file_order order; chunks within each file are
-        processed in chunk index order (guaranteed by S3 key sorting in S3AudioService).
+        Chunks are transcribed concurrently (bounded by TRANSCRIBE_MAX_WORKERS).
+        The results are concatenated in file_order order, and within each file in
+        chunk index order (guaranteed by S3 key sorting in S3AudioService).
 
         Returns:
             Concatenated plain-text transcription.
@@ -94,44 +118,74 @@ class WhisperTranscriptionProvider:
 
         url = f"{settings.llm_base_url.rstrip('/')}/audio/transcriptions"
         headers = {"Authorization": f"Bearer {settings.llm_api_key}"}
+        form_data = self._whisper_form_data(settings)
 
-        parts: list[str] = []
+        chunk_keys: list[str] = []
         for audio_file in sorted(processed, key=lambda af: af.file_order):
-            chunk_keys = s3.list_chunk_keys(session_id, audio_file.id)
+            file_chunk_keys = s3.list_chunk_keys(session_id, audio_file.id)
             logger.info(
                 "whisper_transcribing_file",
                 session_id=session_id,
                 audio_file_id=audio_file.id,
                 file_order=audio_file.file_order,
-                chunk_count=len(chunk_keys),
+                chunk_count=len(file_chunk_keys),
+            )
+            chunk_keys.extend(file_chunk_keys)
+
+        def transcribe_chunk(chunk_key: str) -> str:
+            return self._call_whisper(
+                url=url,
+                headers=headers,
+                chunk_bytes=s3.download_chunk(chunk_key),
+                settings=settings,
+                chunk_extension=chunk_key.rsplit(".", 1)[-1],
+                form_data=form_data,
             )
-            for chunk_key in chunk_keys:
-                chunk_bytes = s3.download_chunk(chunk_key)
-                chunk_text = self._call_whisper(
-                    url=url,
-                    headers=headers,
-                    chunk_bytes=chunk_bytes,
-                    settings=settings,
-                )
-                parts.append(chunk_text)
+
+        # Whisper calls are network-bound; run them concurrently (still throttled by the
+        # shared provider rate limiter). map() keeps chunk order and re-raises the first failure.
+        max_workers = max(1, min(settings.transcribe_max_workers, len(chunk_keys)))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            parts = list(pool.map(transcribe_chunk, chunk_keys))
 
         return " ".join(parts).strip()
 
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _call_whisper(url: str, headers: dict, chunk_bytes: bytes, settings) -> str:
-        """Send a single FLAC chunk to the Whisper endpoint and return text."""
+    def _whisper_form_data(settings) -> dict[str, str]:
+        """Multipart form fields shared by every chunk request of a transcription."""
+        return {
+            "model": settings.transcription_model,
+            "response_format": settings.transcription_response_format,
+            "temperature": str(settings.openai_transcribe_temperature),
+        }
+
+    @staticmethod
+    def _call_whisper(
+        url: str,
+        headers: dict,
+        chunk_bytes: bytes,
+        settings,
+        chunk_extension: str = "flac",
+        form_data: dict[str, str] | None = None,
+    ) -> str:
+        """Send a single audio chunk (FLAC or Ogg/Opus) to the Whisper endpoint and return text.
+
+        `form_data` can be built once per transcription with `_whisper_form_data`;
+        it is derived from `settings` when omitted.
+        """
+        if form_data is None:
+            form_data = WhisperTranscriptionProvider._whisper_form_data(settings)
+        content_type = S3AudioService.CHUNK_CONTENT_TYPES.get(
+            chunk_extension, "application/octet-stream"
+        )
         response = perform_rate_limited_request(
-            lambda: requests.post(
+            lambda: _whisper_http_session().post(
                 url,
                 headers=headers,
-                files={"file": ("chunk.flac", io.BytesIO(chunk_bytes), "audio/flac")},
-                data={
-                    "model": settings.transcription_model,
-                    "response_format": settings.transcription_response_format,
-                    "temperature": str(settings.openai_transcribe_temperature),
-                },
+                files={"file": (f"chunk.{chunk_extension}", io.BytesIO(chunk_bytes), content_type)},
+                data=form_data,
                 timeout=300,  # 5 min per chunk
             ),
             operation_name="whisper_transcription",
@@ -139,7 +193,12 @@ class WhisperTranscriptionProvider:
         response.raise_for_status()
 
         if settings.transcription_response_format == "text":
-            return response.text.strip()
+            # Whisper returns UTF-8; decode the body directly instead of letting
+            # requests guess the charset (text/plain without charset means latin-1)
+            try:
+                return response.content.decode("utf-8").strip()
+            except UnicodeDecodeError:
+                return response.text.strip()
 
         # json / verbose_json
         payload = response.json()
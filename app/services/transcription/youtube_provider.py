@@ -1,5 +1,7 @@
 """YouTube subtitle scraping transcription provider."""
 
+import re
+
 import structlog
 from sqlalchemy.orm import Session as SQLSession
 
@@ -7,6 +9,8 @@ from app.services.transcription.exceptions import TranscriptionUnavailableError
 
 logger = structlog.get_logger()
 
+_VIDEO_ID_RE = re.compile(r"(?:v=|youtu\.be/|embed/)([A-Za-z0-9_-]{11})")
+
 
 class YouTubeTranscriptionProvider:
     """
@@ -103,14 +107,5 @@ class YouTubeTranscriptionProvider:
     @staticmethod
     def _parse_video_id(url: str) -> str | None:
         """Extract YouTube video ID from a URL."""
-        import re
-
-        patterns = [
-            r"(?:v=|youtu\.be/)([A-Za-z0-9_-]{11})",
-            r"(?:embed/)([A-Za-z0-9_-]{11})",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        match = _VIDEO_ID_RE.search(url)
+        return match.group(1) if match else None
@@ -1,6 +1,7 @@
 """Utility functions for common operations."""
 
 import json
+import re
 from datetime import datetime
 
 from fastapi import HTTPException
@@ -93,21 +94,18 @@ class DateTimeUtils:
 class URIUtils:
     """Utilities for URI/slug operations."""
 
+    # Anything that is not a (unicode) word character or hyphen is dropped from slugs
+    _URI_UNSAFE_RE = re.compile(r"[^\w-]")
+    _URI_HYPHEN_RUN_RE = re.compile(r"-{2,}")
+
     @staticmethod
     def generate_uri_from_title(title: str) -> str:
         """Generate a URI-safe slug from a title."""
-        # Convert to lowercase
-        uri = title.lower()
-        # Replace spaces with hyphens
-        uri = uri.replace(" ", "-")
-        # Remove special characters (keep only alphanumeric, hyphens, underscores)
-        uri = "".join(c for c in uri if c.isalnum() or c in "-_")
-        # Replace multiple hyphens with single hyphen
-        while "--" in uri:
-            uri = uri.replace("--", "-")
-        # Remove leading/trailing hyphens
-        uri = uri.strip("-")
-        return uri
+        # Lowercase, turn spaces into hyphens and drop everything except
+        # alphanumerics, hyphens and underscores
+        uri = URIUtils._URI_UNSAFE_RE.sub("", title.lower().replace(" ", "-"))
+        # Collapse hyphen runs and trim leading/trailing hyphens
+        return URIUtils._URI_HYPHEN_RUN_RE.sub("-", uri).strip("-")
 
     @staticmethod
     def ensure_unique_uri(base_uri: str, existing_uris: list) -> str:
@@ -24,20 +24,22 @@ class ChatModelConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to kwargs dict for init_chat_model."""
+        # Resolve settings once instead of once per field
+        settings = get_settings()
         kwargs = {
             "model": self.model,
-            "api_key": get_settings().llm_api_key,
-            "model_provider": get_settings().llm_provider,
-            "base_url": get_settings().llm_base_url,
-            "temperature": get_settings().llm_temperature,
-            "max_tokens": get_settings().llm_max_tokens,
-            "top_p": get_settings().llm_top_p,
+            "api_key": settings.llm_api_key,
+            "model_provider": settings.llm_provider,
+            "base_url": settings.llm_base_url,
+            "temperature": settings.llm_temperature,
+            "max_tokens": settings.llm_max_tokens,
+            "top_p": settings.llm_top_p,
             "max_retries": 3,
             "rate_limiter": DEFAULT_RATE_LIMITER,
             "timeout": httpx.Timeout(
                 connect=12.0,
                 write=90.0,
-                read=get_settings().llm_request_timeout_seconds,
+                read=settings.llm_request_timeout_seconds,
                 pool=30.0,
             ),
         }
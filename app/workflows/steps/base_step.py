@@ -317,21 +317,24 @@ class WorkflowStep(ABC):
             identifier: Step identifier (content key)
             content: Dict with "content", "content_type", "meta_info"
         """
-        db_content = content_crud.create_or_update_content(
-            db=db,
-            session_id=session_id,
-            identifier=identifier,
-            content=content.get("content", ""),
-            content_type=content.get("content_type", "plain_text"),
-            workflow_execution_id=execution_id,
-            meta_info=content.get("meta_info"),
-            ai_generated=True,
-            editorially_reviewed=False,
+        # Add to session's available content identifiers in the same transaction
+        db_content = session_crud.add_available_content_identifier_with(
+            db,
+            session_id,
+            identifier,
+            lambda: content_crud.create_or_update_content(
+                db=db,
+                session_id=session_id,
+                identifier=identifier,
+                content=content.get("content", ""),
+                content_type=content.get("content_type", "plain_text"),
+                workflow_execution_id=execution_id,
+                meta_info=content.get("meta_info"),
+                ai_generated=True,
+                editorially_reviewed=False,
+            ),
         )
 
-        # Add to session's available content identifiers
-        session_crud.add_available_content_identifier(db, session_id, identifier)
-
         logger.info(
             "content_saved_to_db",
             step_id=identifier,
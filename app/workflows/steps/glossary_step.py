@@ -1,7 +1,6 @@
 """Glossary step - extracts specialized terms with one-line definitions."""
 
 import json
-import re
 from typing import Any
 
 import structlog
@@ -11,6 +10,7 @@ from app.config.settings import get_settings
 from app.database.models import Session as SessionModel
 from app.workflows.chat_models import ChatModelConfig
 from app.workflows.execution_context import StepRegistry
+from app.workflows.steps.json_output import extract_json_array_candidate, loads_with_repairs
 from app.workflows.steps.llm_step import LLMStep
 
 logger = structlog.get_logger()
@@ -19,32 +19,6 @@ _GLOSSARY_MIN_ENTRIES = 5
 _GLOSSARY_MAX_ENTRIES = 8
 
 
-def _extract_json_array_candidate(content: str) -> str:
-    raw = content.strip()
-
-    if raw.startswith("```"):
-        match = re.search(r"```(?:json)?\s*(.*?)\s*```", raw, re.DOTALL)
-        if match:
-            raw = match.group(1).strip()
-
-    if not raw.startswith("["):
-        match = re.search(r"\[.*\]", raw, re.DOTALL)
-        if match:
-            raw = match.group(0)
-
-    return raw
-
-
-def _loads_with_repairs(raw: str) -> Any:
-    try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
-        # Repair common LLM JSON issues before giving up.
-        repaired = re.sub(r"}\s*\n\s*{", "},\n{", raw)
-        repaired = re.sub(r",\s*([}\]])", r"\1", repaired)
-        return json.loads(repaired)
-
-
 def _extract_term_definition(item: Any) -> tuple[str, str]:
     if isinstance(item, dict):
         return str(item.get("term", "")).strip(), str(item.get("definition", "")).strip()
@@ -57,8 +31,8 @@ def _extract_term_definition(item: Any) -> tuple[str, str]:
 
 def _extract_structured_items(content: str) -> list[dict[str, str]]:
     """Parse a JSON array of glossary items from model output."""
-    raw = _extract_json_array_candidate(content)
-    parsed = _loads_with_repairs(raw)
+    raw = extract_json_array_candidate(content)
+    parsed = loads_with_repairs(raw)
 
     if not isinstance(parsed, list):
         return []
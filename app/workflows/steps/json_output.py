@@ -0,0 +1,40 @@
+"""Helpers for parsing JSON arrays from LLM step output."""
+
+import json
+import re
+from typing import Any
+
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+_MISSING_OBJECT_COMMA_RE = re.compile(r"}\s*\n\s*{")
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
+
+def extract_json_array_candidate(content: str) -> str:
+    """Strip a code fence and surrounding prose from model output around a JSON array."""
+    raw = content.strip()
+
+    if raw.startswith("```"):
+        match = _JSON_FENCE_RE.search(raw)
+        if match:
+            raw = match.group(1).strip()
+
+    if not raw.startswith("["):
+        match = _JSON_ARRAY_RE.search(raw)
+        if match:
+            raw = match.group(0)
+
+    return raw
+
+
+def loads_with_repairs(raw: str) -> Any:
+    """Parse JSON, retrying once after repairing common LLM JSON issues."""
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        # Try to recover common LLM JSON issues:
+        # - missing comma between object literals
+        # - trailing commas before closing braces/brackets
+        repaired = _MISSING_OBJECT_COMMA_RE.sub("},\n{", raw)
+        repaired = _TRAILING_COMMA_RE.sub(r"\1", repaired)
+        return json.loads(repaired)
@@ -153,10 +153,16 @@ Wähle nun 3-5 prägnante Originalzitate aus dem Transkript aus."""
             )
             return self.process_response(response)
 
-        verified = [q for q in candidates if _is_quote_verified(q, transcription)]
+        # Single pass: partial_ratio scans the whole transcription, so score each candidate once
+        verified: list[str] = []
+        unverified: list[str] = []
+        for quote in candidates:
+            if _is_quote_verified(quote, transcription):
+                verified.append(quote)
+            else:
+                unverified.append(quote)
 
         # Log unverified quotes for debugging
-        unverified = [q for q in candidates if not _is_quote_verified(q, transcription)]
         if unverified:
             logger.warning(
                 "quotes_step_verification_failures",
@@ -15,6 +15,7 @@ from app.config.wordcloud_stopwords import ALL_STOP_WORDS
 from app.database.models import Session as SessionModel
 from app.workflows.chat_models import ChatModelConfig
 from app.workflows.execution_context import StepRegistry
+from app.workflows.steps.json_output import extract_json_array_candidate
 from app.workflows.steps.llm_step import LLMStep
 
 logger = structlog.get_logger()
@@ -63,7 +64,7 @@ def _is_noun_candidate(token: str, text: str, token_start: int) -> bool:
 
 def _pick_display_form(forms: Counter[str]) -> str:
     """Choose the most representative original casing for output."""
-    return sorted(forms.items(), key=lambda item: (-item[1], item[0].islower(), item[0]))[0][0]
+    return min(forms.items(), key=lambda item: (-item[1], item[0].islower(), item[0]))[0]
 
 
 def _compute_word_frequencies(text: str, top_n: int = 70) -> list[tuple[str, int]]:
@@ -112,18 +113,7 @@ def _compute_word_frequencies(text: str, top_n: int = 70) -> list[tuple[str, int
 
 def _extract_json_array_from_response(content: str) -> list[str]:
     """Parse a JSON array from model output and return string items only."""
-    raw = content.strip()
-
-    if raw.startswith("```"):
-        fence_match = re.search(r"```(?:json)?\s*(.*?)\s*```", raw, re.DOTALL)
-        if fence_match:
-            raw = fence_match.group(1).strip()
-
-    if not raw.startswith("["):
-        bracket_match = re.search(r"\[.*\]", raw, re.DOTALL)
-        if bracket_match:
-            raw = bracket_match.group(0)
-
+    raw = extract_json_array_candidate(content)
     parsed = json.loads(raw)
     if not isinstance(parsed, list):
         return []
@@ -0,0 +1,81 @@
+"""Integration tests for the audio file endpoints."""
+
+from unittest.mock import Mock
+
+from app.crud import audio_file as audio_file_crud
+from app.database.models import AudioFileProcessingStatus
+
+
+def test_upload_audio_file_streams_to_s3(client, session_with_owner, sample_api_key, monkeypatch):
+    """Uploaded audio is passed to S3 as a file object and queued for processing."""
+    _, plain_key = sample_api_key
+    uploaded: dict = {}
+
+    def _upload_raw(session_id, audio_file_id, original_filename, fileobj, size_bytes):
+        uploaded["body"] = fileobj.read()
+        uploaded["size_bytes"] = size_bytes
+        return f"raw/session_{session_id}/{audio_file_id}.mp3"
+
+    mock_s3 = Mock()
+    mock_s3.upload_raw.side_effect = _upload_raw
+    monkeypatch.setattr("app.routes.session_content.get_s3_audio_service", lambda: mock_s3)
+    mock_delay = Mock()
+    monkeypatch.setattr("app.routes.session_content.process_audio_upload.delay", mock_delay)
+
+    response = client.post(
+        f"/api/v2/sessions/{session_with_owner.id}/audio-files",
+        headers={"Authorization": f"Bearer {plain_key}"},
+        files={"file": ("talk.mp3", b"ID3 fake audio", "audio/mpeg")},
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["total_size_bytes"] == len(b"ID3 fake audio")
+    assert uploaded == {"body": b"ID3 fake audio", "size_bytes": len(b"ID3 fake audio")}
+    mock_delay.assert_called_once_with(data["id"])
+
+
+def test_upload_audio_file_rejects_empty_file(
+    client, session_with_owner, sample_api_key, monkeypatch
+):
+    """Empty uploads are rejected before anything is stored."""
+    _, plain_key = sample_api_key
+    mock_s3 = Mock()
+    monkeypatch.setattr("app.routes.session_content.get_s3_audio_service", lambda: mock_s3)
+
+    response = client.post(
+        f"/api/v2/sessions/{session_with_owner.id}/audio-files",
+        headers={"Authorization": f"Bearer {plain_key}"},
+        files={"file": ("talk.mp3", b"", "audio/mpeg")},
+    )
+
+    assert response.status_code == 400
+    mock_s3.upload_raw.assert_not_called()
+
+
+def test_delete_audio_file_removes_record_and_s3_objects(
+    client, test_db, session_with_owner, sample_api_key, monkeypatch
+):
+    """Deleting a processed audio file removes its S3 objects and its DB record."""
+    _, plain_key = sample_api_key
+    record = audio_file_crud.create_audio_file(
+        db=test_db,
+        session_id=session_with_owner.id,
+        original_filename="talk.mp3",
+        s3_raw_key="raw/key.mp3",
+        file_order=1,
+        total_size_bytes=10,
+    )
+    audio_file_crud.update_audio_file_status(
+        test_db, record.id, AudioFileProcessingStatus.PROCESSED
+    )
+    mock_s3 = Mock()
+    monkeypatch.setattr("app.routes.session_content.get_s3_audio_service", lambda: mock_s3)
+
+    url = f"/api/v2/sessions/{session_with_owner.id}/audio-files/{record.id}"
+    response = client.delete(url, headers={"Authorization": f"Bearer {plain_key}"})
+
+    assert response.status_code == 204
+    mock_s3.delete_object.assert_called_once_with("raw/key.mp3")
+    assert audio_file_crud.get_audio_file(test_db, record.id) is None
+    assert audio_file_crud.delete_audio_file(test_db, record.id) is False
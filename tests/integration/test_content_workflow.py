@@ -1,6 +1,7 @@
 """Tests for content management and workflow endpoints."""
 
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -196,6 +197,29 @@ class TestContentEndpoints:
         data = response.json()
         assert data["content"] == updated_content
 
+    def test_update_content_unchanged_skips_write(self, client: TestClient, session_with_event):
+        """Saving identical content should return the stored row without rewriting it."""
+        session_data, plain_key = session_with_event
+        session_id = session_data["id"]
+
+        created = client.post(
+            f"/api/v2/sessions/{session_id}/content/transcription",
+            headers={"Authorization": f"Bearer {plain_key}"},
+            json={"content": "Unchanged content"},
+        ).json()
+
+        with patch("app.routes.session_content.content_crud.update_content") as mock_update:
+            response = client.patch(
+                f"/api/v2/sessions/{session_id}/content/transcription",
+                headers={"Authorization": f"Bearer {plain_key}"},
+                json={"content": "Unchanged content"},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["content"] == "Unchanged content"
+        assert response.json()["updated_at"] == created["updated_at"]
+        mock_update.assert_not_called()
+
     def test_update_content_editorial_review_flag(self, client: TestClient, session_with_event):
         """Test toggling editorial review flag for a content identifier."""
         session_data, plain_key = session_with_event
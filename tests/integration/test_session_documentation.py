@@ -121,6 +121,42 @@ class TestSessionDocumentationEndpoint:
         assert data["title"] == "Test Talk"
         assert len(data["sections"]) == 2
 
+    def test_returns_etag_and_304_when_unchanged(
+        self, client: TestClient, session_published, test_db
+    ):
+        """Should answer a matching If-None-Match with 304 and no body."""
+        from app.services.documentation_builder import DocumentationBuilder
+
+        DocumentationBuilder.build_documentation(test_db, session_published.id)
+        test_db.refresh(session_published)
+
+        url = f"/api/v2/sessions/{session_published.id}/documentation"
+        first = client.get(url)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        second = client.get(url, headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert second.content == b""
+
+    def test_etag_changes_after_rebuild(self, client: TestClient, session_published, test_db):
+        """Should serve a fresh body once the artifact has been rebuilt."""
+        from app.services.documentation_builder import DocumentationBuilder
+
+        DocumentationBuilder.build_documentation(test_db, session_published.id)
+        test_db.refresh(session_published)
+
+        url = f"/api/v2/sessions/{session_published.id}/documentation"
+        etag = client.get(url).headers["etag"]
+
+        DocumentationBuilder.build_documentation(test_db, session_published.id)
+        test_db.refresh(session_published)
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
     def test_artifact_contains_all_sections(self, client: TestClient, session_published, test_db):
         """Should include all generated content sections in artifact."""
         from app.services.documentation_builder import DocumentationBuilder
@@ -470,3 +506,33 @@ class TestDocumentationResponseSchema:
         assert response.id == session_published.id
         assert response.title == session_published.title
         assert len(response.sections) == 2
+
+
+class TestListSessionIdsWithContent:
+    """Test the batched content presence lookup used by rebuild-all."""
+
+    def test_returns_only_sessions_with_content(self, session_published, test_db, sample_event):
+        """Should return IDs of sessions that have generated content."""
+        from app.crud.generated_content import list_session_ids_with_content
+
+        now = datetime.utcnow()
+        empty_session = SessionModel(
+            title="Empty Talk",
+            uri="empty-talk",
+            event_id=sample_event.id,
+            start_datetime=now,
+            end_datetime=now + timedelta(hours=1),
+            status=SessionStatus.PUBLISHED,
+        )
+        test_db.add(empty_session)
+        test_db.commit()
+
+        result = list_session_ids_with_content(test_db, [session_published.id, empty_session.id])
+
+        assert result == {session_published.id}
+
+    def test_empty_input_returns_empty_set(self, test_db):
+        """Should not query for an empty ID list."""
+        from app.crud.generated_content import list_session_ids_with_content
+
+        assert list_session_ids_with_content(test_db, []) == set()
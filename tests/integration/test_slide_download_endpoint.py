@@ -53,3 +53,79 @@ def test_download_slide_file_returns_pdf(client, test_db, sample_event, sample_u
     assert response.headers["content-type"].startswith("application/pdf")
     assert "deck.pdf" in response.headers.get("content-disposition", "")
     assert response.content.startswith(b"%PDF")
+
+
+def test_download_slide_file_escapes_filename(client, test_db, sample_event, monkeypatch):
+    """User-supplied slide filenames must not break out of the Content-Disposition header."""
+    now = datetime.utcnow()
+    session = SessionModel(
+        title="Quoted Slides Session",
+        uri="quoted-slides-session",
+        event_id=sample_event.id,
+        start_datetime=now,
+        end_datetime=now + timedelta(hours=1),
+        status=SessionStatus.PUBLISHED,
+    )
+    test_db.add(session)
+    test_db.commit()
+    test_db.refresh(session)
+
+    create_content(
+        db=test_db,
+        session_id=session.id,
+        identifier="slide_deck",
+        content_type="json",
+        content='{"s3_key":"content/summaraizer/slides/deck.pdf","filename":"Fö \\"deck\\".pdf"}',
+    )
+
+    mock_s3 = Mock()
+    mock_s3.download_slide.return_value = b"%PDF-1.7 demo"
+    monkeypatch.setattr(
+        "app.routes.session_content.get_s3_slide_service",
+        lambda: mock_s3,
+    )
+
+    response = client.get(f"/api/v2/sessions/{session.id}/slide-files/download")
+
+    assert response.status_code == 200
+    disposition = response.headers["content-disposition"]
+    assert disposition.startswith('inline; filename="F? _deck_.pdf"')
+    assert "filename*=UTF-8''F%C3%B6%20%22deck%22.pdf" in disposition
+
+
+def test_embed_slide_file_returns_inline_pdf(client, test_db, sample_event, monkeypatch):
+    """Embed endpoint should serve the same PDF inline as the download endpoint."""
+    now = datetime.utcnow()
+    session = SessionModel(
+        title="Embed Slides Session",
+        uri="embed-slides-session",
+        event_id=sample_event.id,
+        start_datetime=now,
+        end_datetime=now + timedelta(hours=1),
+        status=SessionStatus.PUBLISHED,
+    )
+    test_db.add(session)
+    test_db.commit()
+    test_db.refresh(session)
+
+    create_content(
+        db=test_db,
+        session_id=session.id,
+        identifier="slide_deck",
+        content_type="json",
+        content='{"s3_key":"content/summaraizer/slides/deck.pdf","filename":"deck.pdf"}',
+    )
+
+    mock_s3 = Mock()
+    mock_s3.download_slide.return_value = b"%PDF-1.7 demo"
+    monkeypatch.setattr(
+        "app.routes.session_content.get_s3_slide_service",
+        lambda: mock_s3,
+    )
+
+    response = client.get(f"/api/v2/sessions/{session.id}/slide-files/embed")
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == 'inline; filename="deck.pdf"'
+    assert "x-frame-options" not in response.headers
+    mock_s3.download_slide.assert_called_once_with("content/summaraizer/slides/deck.pdf")
@@ -480,7 +480,7 @@ def test_track_generated_content_ignores_session_context_keys(mock_db_session):
             "app.async_jobs.tasks.StepRegistry.get_all_steps",
             return_value={"transcription": Mock(), "summary": Mock(), "tags": Mock()},
         ),
-        patch("app.async_jobs.tasks.session_crud.add_available_content_identifier") as mock_add,
+        patch("app.async_jobs.tasks.session_crud.add_available_content_identifiers") as mock_add,
         patch("app.async_jobs.tasks.content_crud.list_for_session", return_value=created_content),
     ):
         created_ids = tasks_module._track_generated_content(
@@ -490,8 +490,42 @@ def test_track_generated_content_ignores_session_context_keys(mock_db_session):
             db=mock_db_session,
         )
 
-    added_identifiers = [call.args[2] for call in mock_add.call_args_list]
+    mock_add.assert_called_once()
+    added_identifiers = mock_add.call_args.args[2]
     assert added_identifiers == ["transcription", "summary"]
     assert "session_format" not in added_identifiers
     assert "session_tags" not in added_identifiers
     assert created_ids == [1]
+
+
+def test_process_audio_upload_uploads_all_chunks_concurrently():
+    """Every processed chunk should be uploaded with its index before marking processed."""
+    record = Mock(
+        session_id=5,
+        s3_raw_key="raw/key.mp3",
+        original_filename="talk.mp3",
+        processing_status=tasks_module.AudioFileProcessingStatus.PENDING,
+    )
+    mock_s3 = Mock()
+    mock_s3.download_raw.return_value = b"raw"
+    mock_s3.chunk_s3_prefix.return_value = "chunks/5/9/"
+    chunks = [b"c0", b"c1", b"c2"]
+
+    with (
+        patch(
+            "app.config.settings.get_settings", return_value=Mock(audio_chunk_upload_max_workers=2)
+        ),
+        patch("app.async_jobs.tasks.SessionLocal", return_value=MagicMock()),
+        patch("app.async_jobs.tasks.get_s3_audio_service", return_value=mock_s3),
+        patch("app.async_jobs.tasks.audio_file_crud") as mock_crud,
+        patch("app.async_jobs.tasks.AudioProcessingService") as mock_processor_cls,
+    ):
+        mock_crud.get_audio_file.return_value = record
+        mock_processor_cls.return_value.process.return_value = chunks
+        result = tasks_module.process_audio_upload.run(9)
+
+    assert result == {"status": "completed", "audio_file_id": 9, "chunk_count": 3}
+    uploaded = sorted(call.args for call in mock_s3.upload_chunk.call_args_list)
+    assert uploaded == [(5, 9, 0, b"c0"), (5, 9, 1, b"c1"), (5, 9, 2, b"c2")]
+    mock_crud.update_audio_file_processed.assert_called_once()
+    mock_s3.delete_object.assert_called_once_with("raw/key.mp3")
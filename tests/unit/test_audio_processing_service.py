@@ -0,0 +1,111 @@
+"""Tests for AudioProcessingService chunk collection."""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.services.audio_processing_service import (
+    AudioProcessingError,
+    AudioProcessingService,
+    ffmpeg_has_encoder,
+)
+
+
+def _fake_ffmpeg(chunk_names: list[str]):
+    """Build a _run_ffmpeg replacement that writes the given files next to the output pattern."""
+
+    def _run(self, input_path: str, output_pattern: str) -> None:
+        out_dir = os.path.dirname(output_pattern)
+        for name in chunk_names:
+            with open(os.path.join(out_dir, name), "wb") as f:
+                f.write(name.encode("utf-8"))
+
+    return _run
+
+
+def test_process_returns_chunks_in_index_order():
+    """Chunks are returned sorted by name and unrelated files are ignored."""
+    names = ["chunk_0002.flac", "chunk_0000.flac", "chunk_0001.flac", "notes.txt"]
+
+    with patch.object(AudioProcessingService, "_run_ffmpeg", _fake_ffmpeg(names)):
+        chunks = AudioProcessingService().process(b"raw", "talk.mp3")
+
+    assert chunks == [b"chunk_0000.flac", b"chunk_0001.flac", b"chunk_0002.flac"]
+
+
+def test_process_raises_when_no_chunks_produced():
+    """An empty ffmpeg output directory is reported as a processing error."""
+    with (
+        patch.object(AudioProcessingService, "_run_ffmpeg", _fake_ffmpeg([])),
+        pytest.raises(AudioProcessingError, match="no output chunks"),
+    ):
+        AudioProcessingService().process(b"raw", "talk.mp3")
+
+
+def test_process_collects_ogg_chunks_when_opus_is_configured(tmp_path):
+    """With the opus codec ffmpeg writes .ogg chunks into the configured scratch dir."""
+    names = ["chunk_0001.ogg", "chunk_0000.ogg", "chunk_0000.flac"]
+    captured: dict = {}
+
+    def _fake_run(cmd, **_kwargs):
+        captured["cmd"] = cmd
+        _fake_ffmpeg(names)(None, None, cmd[-1])
+        return Mock(returncode=0, stderr="")
+
+    with (
+        patch(
+            "app.services.audio_processing_service.get_settings",
+            return_value=Mock(
+                audio_chunk_codec="opus",
+                audio_opus_bitrate="16k",
+                transcribe_segment_seconds=170,
+                transcribe_max_file_size_mb=25,
+                audio_processing_tmp_dir=str(tmp_path),
+            ),
+        ),
+        patch("app.services.audio_processing_service.ffmpeg_has_encoder", return_value=True),
+        patch("app.services.audio_processing_service.subprocess.run", side_effect=_fake_run),
+    ):
+        chunks = AudioProcessingService().process(b"raw", "talk.mp3")
+
+    assert chunks == [b"chunk_0000.ogg", b"chunk_0001.ogg"]
+    assert captured["cmd"][captured["cmd"].index("-c:a") + 1] == "libopus"
+    assert captured["cmd"][-1].endswith("chunk_%04d.ogg")
+    assert captured["cmd"][-1].startswith(str(tmp_path))
+
+
+def test_opus_falls_back_to_flac_without_libopus():
+    """An ffmpeg build without libopus makes the service write FLAC chunks instead."""
+    with (
+        patch(
+            "app.services.audio_processing_service.get_settings",
+            return_value=Mock(
+                audio_chunk_codec="opus",
+                audio_flac_compression_level=5,
+                transcribe_segment_seconds=170,
+                transcribe_max_file_size_mb=25,
+                audio_processing_tmp_dir="",
+            ),
+        ),
+        patch("app.services.audio_processing_service.ffmpeg_has_encoder", return_value=False),
+    ):
+        service = AudioProcessingService()
+
+    assert service.codec == "flac"
+    assert service.chunk_extension == "flac"
+
+
+def test_ffmpeg_has_encoder_parses_encoder_list():
+    """The encoder probe matches the encoder name column of `ffmpeg -encoders`."""
+    listing = " A....D flac                 FLAC (Free Lossless Audio Codec)\n"
+    ffmpeg_has_encoder.cache_clear()
+    try:
+        with patch(
+            "app.services.audio_processing_service.subprocess.run",
+            return_value=Mock(stdout=listing),
+        ):
+            assert ffmpeg_has_encoder("flac")
+            assert not ffmpeg_has_encoder("libopus")
+    finally:
+        ffmpeg_has_encoder.cache_clear()
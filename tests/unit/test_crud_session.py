@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 import pytest
 
+from app.crud import generated_content as content_crud
 from app.crud.session import session_crud
 from app.database.models import SessionFormat, SessionPopularity, SessionStatus
 from app.schemas.session import SessionCreate, SessionUpdate
@@ -219,6 +220,63 @@ class TestSessionCRUD:
 
         assert count >= 1
 
+    def test_add_available_content_identifiers_batches_missing(self, test_db, sample_session):
+        """Test that several identifiers are added once each, in order, in one update."""
+        session_crud.add_available_content_identifier(test_db, sample_session.id, "summary")
+
+        updated = session_crud.add_available_content_identifiers(
+            test_db, sample_session.id, ["transcription", "summary", "tags", "tags"]
+        )
+
+        assert updated.available_content_identifiers == ["summary", "transcription", "tags"]
+
+    def test_add_available_content_identifier_staged_with_content(self, test_db, sample_session):
+        """Test that a staged identifier is committed by the content insert that follows."""
+        session_crud.add_available_content_identifier(
+            test_db, sample_session.id, "summary", commit=False
+        )
+        content_crud.create_content(test_db, sample_session.id, "summary", "Text")
+        test_db.rollback()
+
+        stored = session_crud.read(test_db, sample_session.id)
+        assert stored.available_content_identifiers == ["summary"]
+        assert content_crud.get_content_by_identifier(test_db, sample_session.id, "summary")
+
+    def test_add_available_content_identifier_with_rolls_back_on_failure(
+        self, test_db, sample_session
+    ):
+        """Test that a failed content save does not leave the identifier staged."""
+        session_id = sample_session.id
+
+        def failing_save():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            session_crud.add_available_content_identifier_with(
+                test_db, session_id, "summary", failing_save
+            )
+        test_db.commit()
+
+        stored = session_crud.read(test_db, session_id)
+        assert stored.available_content_identifiers == []
+
+    def test_add_available_content_identifiers_missing_session(self, test_db):
+        """Test that unknown sessions return None."""
+        assert session_crud.add_available_content_identifiers(test_db, 99999, ["summary"]) is None
+
+    def test_get_available_tags_and_locations_dedupes(self, test_db, sample_session):
+        """Test that tags are stripped, blank tags dropped and duplicates collapsed."""
+        session_crud.update(
+            test_db, sample_session.id, SessionUpdate(tags=[" AI ", "", "Testing", "AI"])
+        )
+
+        tags, locations = session_crud.get_available_tags_and_locations(
+            test_db, sample_session.event_id, status=SessionStatus.DRAFT
+        )
+
+        assert tags == ["AI", "Testing"]
+        assert locations == []
+
 
 class TestSessionEventEmissions:
     """Test suite for session event emissions via event bus."""
@@ -659,6 +659,41 @@ class TestTagFilteringWhereClause:
 # ============================================================================
 
 
+# ============================================================================
+# Query Cache Tests
+# ============================================================================
+
+
+class TestEmbeddingQueryCache:
+    """Test Redis-backed query embedding cache serialization."""
+
+    @pytest.mark.asyncio
+    async def test_set_then_get_round_trips_embedding(self):
+        """Embeddings written by set() should be returned unchanged by get()."""
+        store: dict[str, str] = {}
+        client = Mock()
+        client.set.side_effect = lambda key, value, **_kwargs: store.__setitem__(
+            key, value.decode("utf-8") if isinstance(value, bytes) else value
+        )
+        client.get.side_effect = store.get
+        cache = EmbeddingQueryCache(redis_url=None, ttl_seconds=60, redis_client=client)
+
+        await cache.set("  test   query ", [0.25, -1.5, 3])
+        result = await cache.get("test query")
+
+        assert result == [0.25, -1.5, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_get_discards_invalid_payload(self):
+        """Corrupt cache entries should be deleted and treated as a miss."""
+        client = Mock()
+        client.get.return_value = "not-json"
+        cache = EmbeddingQueryCache(redis_url=None, ttl_seconds=60, redis_client=client)
+
+        assert await cache.get("test query") is None
+        client.delete.assert_called_once()
+
+
 # ============================================================================
 # Performance Tests
 # ============================================================================
@@ -45,16 +45,20 @@ def test_whisper_retries_after_rate_limit_then_returns_text():
         "raise_for_status should only run on the final response"
     )
 
-    success_response = Mock(status_code=200, headers={}, text=" transcribed text ")
+    success_response = Mock(status_code=200, headers={}, content=b" transcribed text ")
     success_response.raise_for_status.return_value = None
 
+    http_session = Mock()
+    http_session.post.side_effect = [rate_limited_response, success_response]
+    post_mock = http_session.post
+
     with (
         patch("app.services.provider_request_control.DEFAULT_RATE_LIMITER.acquire"),
         patch("app.services.provider_request_control.time.sleep") as sleep_mock,
         patch(
-            "app.services.transcription.whisper_provider.requests.post",
-            side_effect=[rate_limited_response, success_response],
-        ) as post_mock,
+            "app.services.transcription.whisper_provider._whisper_http_session",
+            return_value=http_session,
+        ),
     ):
         result = WhisperTranscriptionProvider._call_whisper(
             url="https://example.test/audio/transcriptions",
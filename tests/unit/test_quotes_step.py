@@ -0,0 +1,38 @@
+"""Unit tests for quote verification in the quotes step."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.workflows.steps import quotes_step
+from app.workflows.steps.quotes_step import QuotesStep
+
+
+@pytest.mark.asyncio
+async def test_quotes_step_scores_each_candidate_once():
+    """Each candidate quote is fuzzy-matched against the transcription exactly once."""
+    transcription = "Wir müssen die Dokumentation gemeinsam verbessern, sagte sie heute."
+    raw_output = (
+        "> „Wir müssen die Dokumentation gemeinsam verbessern“\n\n"
+        "> „Ein völlig erfundenes Zitat über Raumfahrt und Mondbasen“"
+    )
+    step = QuotesStep()
+    model = Mock()
+    model.ainvoke = AsyncMock(return_value=SimpleNamespace(content=raw_output))
+    session = SimpleNamespace(id=1, title="Talk", speakers=[])
+
+    with (
+        patch.object(step, "get_messages", return_value=[]),
+        patch.object(step, "get_model", return_value=model),
+        patch.object(
+            quotes_step, "_is_quote_verified", wraps=quotes_step._is_quote_verified
+        ) as mock_verify,
+    ):
+        result = await step._invoke_and_process(session, {"transcription": transcription})
+
+    assert mock_verify.call_count == 2
+    assert result["meta_info"]["verified"] == 1
+    assert result["meta_info"]["candidates"] == 2
+    assert "Dokumentation gemeinsam verbessern" in result["content"]
+    assert "Raumfahrt" not in result["content"]
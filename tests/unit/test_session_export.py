@@ -0,0 +1,84 @@
+"""Tests for session export text rendering."""
+
+import io
+import zipfile
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.crud import generated_content as content_crud
+from app.services.session_export import (
+    build_zip_bytes,
+    markdown_to_text,
+    session_metadata_header,
+)
+
+
+def test_markdown_to_text_empty_input():
+    """Empty markdown renders as a single newline."""
+    assert markdown_to_text("") == "\n"
+
+
+def test_markdown_to_text_headings_paragraphs_and_punctuation():
+    """Headings get a blank line and stray spaces before punctuation are removed."""
+    text = markdown_to_text("# Title\n\nHello *world* , again !")
+
+    assert text == "Title\n\nHello world, again!\n"
+
+
+def test_markdown_to_text_collapses_blank_lines():
+    """Runs of three or more newlines are collapsed to one blank line."""
+    text = markdown_to_text("# One\n\n# Two\n\n# Three")
+
+    assert "\n\n\n" not in text
+    assert text == "One\n\nTwo\n\nThree\n"
+
+
+def test_markdown_to_text_lists():
+    """Unordered, ordered and nested lists are rendered with markers and indentation."""
+    md = "- alpha\n- beta\n  1. one\n  2. two\n\n1. first\n2. second\n"
+
+    text = markdown_to_text(md)
+
+    assert text == "- alpha\n- beta\n  1. one\n  2. two\n\n1. first\n2. second\n"
+
+
+def test_markdown_to_text_blockquote_and_code():
+    """Blockquotes are prefixed and code blocks indented."""
+    text = markdown_to_text("> quoted line\n\n```\ncode()\n```\n")
+
+    assert "> quoted line" in text
+    assert "    code()" in text
+
+
+def test_build_zip_bytes_prefetches_contents(test_db, sample_event, sample_session):
+    """Summaries and transcripts are loaded in one batch, not per session."""
+    content_crud.create_content(test_db, sample_session.id, "summary", "# Summary")
+    content_crud.create_content(test_db, sample_session.id, "transcription", "Spoken words")
+
+    with patch(
+        "app.services.session_export.get_generated_content_by_identifier"
+    ) as per_session_lookup:
+        data = build_zip_bytes(sample_event, [sample_session], test_db, include_metadata=False)
+
+    per_session_lookup.assert_not_called()
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert zf.read("test-event/test-session/summary.md").decode() == "# Summary"
+        assert zf.read("test-event/test-session/transcript.txt").decode() == "Spoken words"
+        assert "index.md" in zf.namelist()
+
+
+def test_session_metadata_header_lists_present_fields_in_order():
+    """Only fields with values are emitted, in the fixed header order."""
+    session = SimpleNamespace(
+        language="de",
+        tags=["KI", "Lehre"],
+        speakers=[{"name": "Ada"}, "Grace"],
+        location_rel=SimpleNamespace(name="Raum 1", city=None),
+    )
+
+    header = session_metadata_header(session)
+
+    assert header == (
+        "---\nTags: KI, Lehre\nSprache: de\nReferent:innen: Ada, Grace\nOrt: Raum 1\n---\n"
+    )
+    assert session_metadata_header(SimpleNamespace()) == ""
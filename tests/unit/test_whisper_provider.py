@@ -1,5 +1,6 @@
 """Tests for WhisperTranscriptionProvider status handling."""
 
+import threading
 from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
@@ -7,7 +8,10 @@ import pytest
 
 from app.database.models import AudioFileProcessingStatus
 from app.services.transcription.exceptions import TranscriptionPendingError
-from app.services.transcription.whisper_provider import WhisperTranscriptionProvider
+from app.services.transcription.whisper_provider import (
+    WhisperTranscriptionProvider,
+    _whisper_http_session,
+)
 
 
 def test_can_handle_returns_true_for_mixed_processed_and_pending_files():
@@ -45,3 +49,130 @@ def test_can_handle_raises_when_only_pending_files_exist():
         pytest.raises(TranscriptionPendingError, match="still processing"),
     ):
         provider.can_handle(session_id=32, db=db, context={})
+
+
+def test_call_whisper_decodes_text_response_as_utf8():
+    """Plain-text responses are decoded as UTF-8 even without a charset header."""
+    body = "  Grüße aus der Vorlesung  ".encode()
+    response = Mock(content=body, text=body.decode("latin-1"))
+    settings = SimpleNamespace(
+        transcription_model="whisper-1",
+        transcription_response_format="text",
+        openai_transcribe_temperature=0,
+    )
+
+    with patch(
+        "app.services.transcription.whisper_provider.perform_rate_limited_request",
+        return_value=response,
+    ):
+        text = WhisperTranscriptionProvider._call_whisper(
+            url="http://llm/audio/transcriptions",
+            headers={},
+            chunk_bytes=b"flac",
+            settings=settings,
+        )
+
+    assert text == "Grüße aus der Vorlesung"
+
+
+def test_transcribe_joins_concurrent_chunks_in_file_and_chunk_order():
+    """Chunks are transcribed concurrently but joined in file_order, then chunk order."""
+    provider = WhisperTranscriptionProvider()
+    audio_files = [
+        SimpleNamespace(
+            id=2,
+            file_order=2,
+            s3_prefix="p2",
+            processing_status=AudioFileProcessingStatus.PROCESSED,
+        ),
+        SimpleNamespace(
+            id=1,
+            file_order=1,
+            s3_prefix="p1",
+            processing_status=AudioFileProcessingStatus.PROCESSED,
+        ),
+    ]
+    mock_s3 = Mock()
+    mock_s3.list_chunk_keys.side_effect = lambda _session_id, audio_file_id: [
+        f"f{audio_file_id}/c0",
+        f"f{audio_file_id}/c1",
+    ]
+    mock_s3.download_chunk.side_effect = lambda key: key.encode()
+
+    with (
+        patch("app.crud.audio_file.get_audio_files_for_session", return_value=audio_files),
+        patch(
+            "app.services.transcription.whisper_provider.get_s3_audio_service",
+            return_value=mock_s3,
+        ),
+        patch.object(
+            WhisperTranscriptionProvider,
+            "_call_whisper",
+            side_effect=lambda **kwargs: kwargs["chunk_bytes"].decode(),
+        ),
+    ):
+        text = provider.transcribe(session_id=32, db=Mock(), context={})
+
+    assert text == "f1/c0 f1/c1 f2/c0 f2/c1"
+
+
+def test_transcribe_gives_each_pool_worker_its_own_http_session():
+    """Concurrent chunk workers never share a requests.Session; each thread reuses its own."""
+    provider = WhisperTranscriptionProvider()
+    audio_files = [
+        SimpleNamespace(
+            id=1,
+            file_order=1,
+            s3_prefix="p1",
+            processing_status=AudioFileProcessingStatus.PROCESSED,
+        ),
+    ]
+    chunk_keys = [f"f1/c{i}" for i in range(4)]
+    mock_s3 = Mock()
+    mock_s3.list_chunk_keys.return_value = chunk_keys
+    mock_s3.download_chunk.side_effect = lambda key: key.encode()
+    settings = SimpleNamespace(
+        llm_base_url="http://llm",
+        llm_api_key="test-key",
+        transcription_model="whisper-1",
+        transcription_response_format="text",
+        openai_transcribe_temperature=0,
+        transcribe_max_workers=2,
+    )
+
+    # Both workers must be inside a call at the same time, so they are distinct threads
+    barrier = threading.Barrier(2, timeout=5)
+    sessions_by_thread: dict[int, set[int]] = {}
+    lock = threading.Lock()
+
+    def fake_call_whisper(**kwargs):
+        barrier.wait()
+        session = _whisper_http_session()
+        assert _whisper_http_session() is session
+        with lock:
+            sessions_by_thread.setdefault(threading.get_ident(), set()).add(id(session))
+        return kwargs["chunk_bytes"].decode()
+
+    with (
+        patch("app.crud.audio_file.get_audio_files_for_session", return_value=audio_files),
+        patch(
+            "app.services.transcription.whisper_provider.get_s3_audio_service",
+            return_value=mock_s3,
+        ),
+        patch(
+            "app.services.transcription.whisper_provider.get_settings",
+            return_value=settings,
+        ),
+        patch.object(
+            WhisperTranscriptionProvider,
+            "_call_whisper",
+            side_effect=fake_call_whisper,
+        ),
+    ):
+        text = provider.transcribe(session_id=32, db=Mock(), context={})
+
+    assert text == " ".join(chunk_keys)
+    assert len(sessions_by_thread) == 2
+    # One session per thread, and no session shared across threads
+    assert all(len(ids) == 1 for ids in sessions_by_thread.values())
+    assert len(set().union(*sessions_by_thread.values())) == 2
@@ -0,0 +1,22 @@
+"""Tests for YouTubeTranscriptionProvider URL parsing."""
+
+import pytest
+
+from app.services.transcription.youtube_provider import YouTubeTranscriptionProvider
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://youtu.be/dQw4w9WgXcQ?t=42", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/embed/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://www.youtube-nocookie.com/embed/dQw4w9WgXcQ?rel=0", "dQw4w9WgXcQ"),
+        ("https://vimeo.com/123456789", None),
+        ("https://www.youtube.com/watch?v=short", None),
+    ],
+)
+def test_parse_video_id(url, expected):
+    """Video IDs are extracted from watch, short and embed URLs."""
+    assert YouTubeTranscriptionProvider._parse_video_id(url) == expected